@@ -0,0 +1 @@
+"""Small shared helpers with no database or network dependencies."""
@@ -0,0 +1,21 @@
+"""
+CSV export helpers.
+
+Guards exported cells against formula injection in Excel/Google Sheets.
+"""
+
+# Leading characters that spreadsheets treat as the start of a formula
+_DANGEROUS_PREFIXES = ('=', '+', '-', '@', '|')
+
+
+def sanitize_csv_cell(value):
+    """
+    Prevent CSV formula injection by escaping dangerous leading characters.
+    
+    Excel/Google Sheets execute cells starting with: = + - @ |
+    Prefix with single quote to treat as text instead of formula.
+    Non-string values (and empty strings) are returned unchanged.
+    """
+    if isinstance(value, str) and value.startswith(_DANGEROUS_PREFIXES):
+        return "'" + value
+    return value
@@ -10,6 +10,7 @@ from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_cache import FastAPICache
@@ -18,7 +19,7 @@ from fastapi_cache.decorator import cache
 from redis import asyncio as aioredis
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.orm import Session, selectinload, joinedload
 
 # Add scoring package to path
@@ -324,14 +325,22 @@ async def startup():
         print("✓ FastAPI cache initialized with in-memory backend")
 
 
-def generate_etag(content: str, preset: str = "equal") -> str:
+def generate_etag(content: str | bytes | dict, preset: str = "equal") -> str:
     """
     Generate ETag from response content + preset.
 
     Ensures cache key varies by preset parameter (Task 0e requirement).
+    Dicts are serialized canonically with orjson (sorted keys); the bytes
+    are hashed with BLAKE2b keyed on the preset, so no concatenated copy
+    of the payload is built.
     """
-    hash_input = f"{content}:{preset}"
-    return hashlib.md5(hash_input.encode()).hexdigest()
+    if isinstance(content, dict):
+        payload = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    elif isinstance(content, str):
+        payload = content.encode()
+    else:
+        payload = content
+    return hashlib.blake2b(payload, digest_size=16, key=preset.encode()).hexdigest()
 
 
 @app.get("/")
@@ -557,8 +566,7 @@ async def get_index(
     }
 
     # Generate ETag (varies by preset per Task 0e)
-    content_json = json.dumps(result, sort_keys=True)
-    etag = generate_etag(content_json, preset)
+    etag = generate_etag(result, preset)
 
     # Check If-None-Match header
     if_none_match = request.headers.get("if-none-match")
@@ -2392,11 +2400,10 @@ async def retract_event(
         event.retraction_evidence_url = evidence_url
 
         # Get affected signposts for recomputation
-        affected_signposts = db.query(EventSignpostLink).filter(
-            EventSignpostLink.event_id == event_id
-        ).all()
-
-        affected_signpost_ids = [link.signpost_id for link in affected_signposts]
+        # Only the ids are needed; skip loading full link entities
+        affected_signpost_ids = db.execute(
+            select(EventSignpostLink.signpost_id).where(EventSignpostLink.event_id == event_id)
+        ).scalars().all()
 
         # Create changelog entry
         changelog = ChangelogEntry(
@@ -12,11 +12,12 @@ from sqlalchemy import func, and_, or_
 from pydantic import BaseModel
 import hashlib
 import json
-from statistics import median, mean, stdev
+from statistics import median, stdev
 
 from app.database import get_db
 from app.auth import limiter, api_key_or_ip
-from app.models import Forecast, Signpost
+from app.models import Forecast
+from app.services.forecast_consensus import compute_consensus
 from fastapi_cache.decorator import cache
 
 
@@ -79,61 +80,13 @@ async def get_consensus(
     Cache: 5 minutes
     """
     
-    # Query forecasts
-    query = db.query(Forecast).join(Signpost, Forecast.signpost_code == Signpost.code)
-    
-    if signpost:
-        query = query.filter(Forecast.signpost_code == signpost)
-    
-    forecasts = query.all()
-    
-    # Group by signpost
-    by_signpost = {}
-    for forecast in forecasts:
-        code = forecast.signpost_code
-        if code not in by_signpost:
-            by_signpost[code] = []
-        by_signpost[code].append(forecast)
-    
-    # Calculate consensus for each signpost
-    results = []
-    for signpost_code, signpost_forecasts in by_signpost.items():
-        timelines = [f.timeline for f in signpost_forecasts]
-        confidences = [f.confidence for f in signpost_forecasts if f.confidence is not None]
-        
-        # Convert dates to timestamps for mean calculation
-        timeline_timestamps = [(t - date(1970, 1, 1)).days for t in timelines]
-        
-        # Calculate stats
-        median_days = median(timeline_timestamps) if timeline_timestamps else None
-        mean_days = mean(timeline_timestamps) if timeline_timestamps else None
-        
-        median_timeline = date(1970, 1, 1) + timedelta(days=int(median_days)) if median_days else None
-        mean_timeline = date(1970, 1, 1) + timedelta(days=int(mean_days)) if mean_days else None
-        
-        earliest = min(timelines) if timelines else None
-        latest = max(timelines) if timelines else None
-        spread = (latest - earliest).days if earliest and latest else None
-        
-        # Get signpost name
-        signpost_obj = db.query(Signpost).filter(Signpost.code == signpost_code).first()
-        signpost_name = signpost_obj.name if signpost_obj else signpost_code
-        
-        results.append(ConsensusResponse(
-            signpost_code=signpost_code,
-            signpost_name=signpost_name,
-            forecast_count=len(signpost_forecasts),
-            median_timeline=median_timeline,
-            mean_timeline=mean_timeline,
-            earliest_timeline=earliest,
-            latest_timeline=latest,
-            timeline_spread_days=spread,
-            mean_confidence=mean(confidences) if confidences else None,
-            forecasts=[ForecastResponse.from_orm(f) for f in signpost_forecasts]
-        ))
-    
-    # Sort by forecast count (most predicted first)
-    results.sort(key=lambda x: x.forecast_count, reverse=True)
+    results = [
+        ConsensusResponse(
+            **{k: v for k, v in row.items() if k != "forecasts"},
+            forecasts=[ForecastResponse.from_orm(f) for f in row["forecasts"]],
+        )
+        for row in compute_consensus(signpost, db)
+    ]
     
     # Add cache headers
     etag_content = json.dumps([r.dict() for r in results], default=str, sort_keys=True)
@@ -4,11 +4,10 @@ Incidents API router.
 Provides endpoints for tracking AI safety incidents, jailbreaks, and misuses.
 """
 
-from datetime import date, timedelta
+from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
 from pydantic import BaseModel, Field
 import hashlib
 import json
@@ -17,7 +16,7 @@ import io
 
 from app.database import get_db
 from app.auth import limiter, api_key_or_ip
-from app.models import Incident
+from app.services.incidents import compute_incident_stats, query_incidents
 from fastapi_cache.decorator import cache
 
 
@@ -86,28 +85,15 @@ async def get_incidents(
     Cache: 5 minutes
     """
     
-    query = db.query(Incident)
-    
-    # Apply filters
-    if since:
-        query = query.filter(Incident.occurred_at >= since)
-    
-    if until:
-        query = query.filter(Incident.occurred_at <= until)
-    
-    if severity:
-        query = query.filter(Incident.severity == severity)
-    
-    if vector:
-        # JSON array containment check
-        query = query.filter(Incident.vectors.contains([vector]))
-    
-    if signpost:
-        # JSON array containment check
-        query = query.filter(Incident.signpost_codes.contains([signpost]))
-    
-    # Order by most recent first
-    incidents = query.order_by(desc(Incident.occurred_at)).limit(limit).all()
+    incidents = query_incidents(
+        db,
+        since=since,
+        until=until,
+        severity=severity,
+        vector=vector,
+        signpost=signpost,
+        limit=limit,
+    )
     
     # CSV export
     if format == "csv":
@@ -175,37 +161,7 @@ async def get_incident_stats(
     Cache: 10 minutes
     """
     
-    since_date = date.today() - timedelta(days=days)
-    
-    incidents = db.query(Incident).filter(
-        Incident.occurred_at >= since_date
-    ).all()
-    
-    # Severity breakdown
-    severity_counts = {i: 0 for i in range(1, 6)}
-    for incident in incidents:
-        severity_counts[incident.severity] = severity_counts.get(incident.severity, 0) + 1
-    
-    # Vector breakdown
-    vector_counts = {}
-    for incident in incidents:
-        if incident.vectors:
-            for vector in incident.vectors:
-                vector_counts[vector] = vector_counts.get(vector, 0) + 1
-    
-    # Monthly trend
-    monthly_counts = {}
-    for incident in incidents:
-        month_key = incident.occurred_at.strftime('%Y-%m')
-        monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
-    
-    result = {
-        "total": len(incidents),
-        "period_days": days,
-        "by_severity": severity_counts,
-        "by_vector": dict(sorted(vector_counts.items(), key=lambda x: x[1], reverse=True)),
-        "by_month": dict(sorted(monthly_counts.items()))
-    }
+    result = compute_incident_stats(db, days)
     
     # Add cache headers
     etag_content = json.dumps(result, sort_keys=True)
@@ -5,29 +5,49 @@ Provides endpoints for composite AGI progress tracking.
 """
 
 from datetime import date, timedelta
-from typing import Optional, Dict
+from typing import Annotated, Optional, Dict
 from fastapi import APIRouter, Depends, Query, Request, Response, Body
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 from app.database import get_db
 from app.auth import limiter, api_key_or_ip
-from app.services.progress_index import compute_progress_index
+from app.services.progress_index import compute_progress_index, compute_progress_index_cached
 from fastapi_cache.decorator import cache
 import hashlib
 import json
+import orjson
 
 
 class SimulateRequest(BaseModel):
     """Request body for weight simulation."""
-    weights: Dict[str, float]
+    weights: Dict[str, Annotated[float, Field(ge=0)]]
     thresholds: Optional[Dict[str, float]] = None
+    
+    @field_validator("weights")
+    @classmethod
+    def weights_not_all_zero(cls, v: Dict[str, float]) -> Dict[str, float]:
+        # Weights are normalized to sum to 1, which needs a positive total
+        if not any(v.values()):
+            raise ValueError("at least one weight must be positive")
+        return v
 
 
 router = APIRouter(prefix="/v1/index", tags=["progress-index"])
 
 
+def _result_etag(result: dict) -> str:
+    """
+    Quoted ETag for a JSON-serializable result.
+    
+    Canonical (sorted-key) orjson bytes hashed with BLAKE2b, matching
+    generate_etag in app.main.
+    """
+    payload = orjson.dumps(result, option=orjson.OPT_SORT_KEYS)
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
 @router.get("/progress")
 @limiter.limit("100/minute", key_func=api_key_or_ip)
 @cache(expire=300)  # 5 minute cache
@@ -146,14 +166,14 @@ async def simulate_progress(
         Simulated index + diff vs baseline (equal weights)
     
     Rate limit: 30/minute (heavier computation)
-    Cached 30s based on payload hash
+    Cached 30s with a content ETag; a matching If-None-Match returns 304
     """
     
-    # Compute with custom weights
-    simulated = compute_progress_index(db, weights=body.weights)
+    # Compute with custom weights (memoized per weight vector for 30s)
+    simulated = compute_progress_index_cached(db, weights=body.weights)
     
     # Compute baseline (equal weights) for comparison
-    baseline = compute_progress_index(db, weights=None)
+    baseline = compute_progress_index_cached(db, weights=None)
     
     # Calculate diff
     diff = {
@@ -170,9 +190,14 @@ async def simulate_progress(
         'diff': diff
     }
     
-    # Cache based on payload hash (30s TTL)
-    payload_hash = hashlib.md5(json.dumps(body.dict(), sort_keys=True).encode()).hexdigest()
-    response.headers["ETag"] = f'"{payload_hash}"'
+    # ETag over the result (not the payload) so it changes with the data
+    etag = _result_etag(result)
+    
+    # Client already has this result: skip re-sending the body
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
     response.headers["Cache-Control"] = "public, max-age=30"
     
     return result
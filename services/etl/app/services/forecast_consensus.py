@@ -0,0 +1,86 @@
+"""
+Forecast consensus service.
+
+Aggregates expert forecasts per signpost into consensus timeline stats.
+Shared by the /v1/forecasts/consensus route and callable directly from
+tests and tasks without going through the HTTP stack.
+"""
+from datetime import date, timedelta
+from statistics import mean, median
+
+from sqlalchemy.orm import Session
+
+from app.models import Forecast, Signpost
+
+
+EPOCH = date(1970, 1, 1)
+
+
+def compute_consensus(signpost_code: str | None, db: Session) -> list[dict]:
+    """
+    Compute consensus forecast stats per signpost.
+
+    Args:
+        signpost_code: Optional signpost code to restrict the aggregation to
+        db: Database session
+
+    Returns:
+        List of consensus dicts (most-forecast signposts first). Each dict
+        carries the raw Forecast rows under "forecasts".
+    """
+    query = db.query(Forecast).join(Signpost, Forecast.signpost_code == Signpost.code)
+
+    if signpost_code:
+        query = query.filter(Forecast.signpost_code == signpost_code)
+
+    forecasts = query.all()
+
+    # Group by signpost
+    by_signpost = {}
+    for forecast in forecasts:
+        code = forecast.signpost_code
+        if code not in by_signpost:
+            by_signpost[code] = []
+        by_signpost[code].append(forecast)
+
+    # Calculate consensus for each signpost
+    results = []
+    for code, signpost_forecasts in by_signpost.items():
+        timelines = [f.timeline for f in signpost_forecasts]
+        confidences = [f.confidence for f in signpost_forecasts if f.confidence is not None]
+
+        # Convert dates to day offsets for mean calculation
+        timeline_timestamps = [(t - EPOCH).days for t in timelines]
+
+        # Calculate stats
+        median_days = median(timeline_timestamps) if timeline_timestamps else None
+        mean_days = mean(timeline_timestamps) if timeline_timestamps else None
+
+        median_timeline = EPOCH + timedelta(days=int(median_days)) if median_days else None
+        mean_timeline = EPOCH + timedelta(days=int(mean_days)) if mean_days else None
+
+        earliest = min(timelines) if timelines else None
+        latest = max(timelines) if timelines else None
+        spread = (latest - earliest).days if earliest and latest else None
+
+        # Get signpost name
+        signpost_obj = db.query(Signpost).filter(Signpost.code == code).first()
+        signpost_name = signpost_obj.name if signpost_obj else code
+
+        results.append({
+            "signpost_code": code,
+            "signpost_name": signpost_name,
+            "forecast_count": len(signpost_forecasts),
+            "median_timeline": median_timeline,
+            "mean_timeline": mean_timeline,
+            "earliest_timeline": earliest,
+            "latest_timeline": latest,
+            "timeline_spread_days": spread,
+            "mean_confidence": mean(confidences) if confidences else None,
+            "forecasts": signpost_forecasts,
+        })
+
+    # Sort by forecast count (most predicted first)
+    results.sort(key=lambda x: x["forecast_count"], reverse=True)
+
+    return results
@@ -0,0 +1,103 @@
+"""
+Incident query service.
+
+Filtering and aggregation behind the /v1/incidents routes, callable directly
+from tests and tasks without going through the HTTP stack.
+"""
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import desc
+from sqlalchemy.orm import Session
+
+from app.models import Incident
+
+
+def query_incidents(
+    db: Session,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    severity: Optional[int] = None,
+    vector: Optional[str] = None,
+    signpost: Optional[str] = None,
+    limit: int = 50,
+) -> list[Incident]:
+    """
+    Fetch incidents matching the given filters, most recent first.
+
+    Args:
+        db: Database session
+        since: Only incidents on or after this date
+        until: Only incidents on or before this date
+        severity: Exact severity level (1-5)
+        vector: Incident vector the row must contain
+        signpost: Signpost code the row must reference
+        limit: Max rows to return
+
+    Returns:
+        List of Incident rows
+    """
+    query = db.query(Incident)
+
+    if since:
+        query = query.filter(Incident.occurred_at >= since)
+
+    if until:
+        query = query.filter(Incident.occurred_at <= until)
+
+    if severity:
+        query = query.filter(Incident.severity == severity)
+
+    if vector:
+        # JSON array containment check
+        query = query.filter(Incident.vectors.contains([vector]))
+
+    if signpost:
+        # JSON array containment check
+        query = query.filter(Incident.signpost_codes.contains([signpost]))
+
+    return query.order_by(desc(Incident.occurred_at)).limit(limit).all()
+
+
+def compute_incident_stats(db: Session, days: int = 90) -> dict:
+    """
+    Aggregate incident counts over the last ``days`` days.
+
+    Args:
+        db: Database session
+        days: Size of the lookback window in days
+
+    Returns:
+        Dict with total, period_days, by_severity, by_vector and by_month
+    """
+    since_date = date.today() - timedelta(days=days)
+
+    incidents = db.query(Incident).filter(
+        Incident.occurred_at >= since_date
+    ).all()
+
+    # Severity breakdown
+    severity_counts = {i: 0 for i in range(1, 6)}
+    for incident in incidents:
+        severity_counts[incident.severity] = severity_counts.get(incident.severity, 0) + 1
+
+    # Vector breakdown
+    vector_counts = {}
+    for incident in incidents:
+        if incident.vectors:
+            for vector in incident.vectors:
+                vector_counts[vector] = vector_counts.get(vector, 0) + 1
+
+    # Monthly trend
+    monthly_counts = {}
+    for incident in incidents:
+        month_key = incident.occurred_at.strftime('%Y-%m')
+        monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
+
+    return {
+        "total": len(incidents),
+        "period_days": days,
+        "by_severity": severity_counts,
+        "by_vector": dict(sorted(vector_counts.items(), key=lambda x: x[1], reverse=True)),
+        "by_month": dict(sorted(monthly_counts.items()))
+    }
@@ -5,6 +5,9 @@ Computes a composite index (0-100) combining all signpost dimensions
 with configurable weights.
 """
 
+import math
+import time
+from copy import deepcopy
 from datetime import date, datetime
 from typing import Dict, Optional
 from sqlalchemy.orm import Session
@@ -12,6 +15,31 @@ from sqlalchemy import func
 
 from app.models import Signpost, EventSignpostLink
 
+# Memoized index results per (database bind, weight vector). The TTL
+# matches the simulate endpoint's Cache-Control max-age, so results are
+# never staler than what clients are already told to reuse (ingestion
+# workers can't clear it).
+INDEX_CACHE_TTL_SECONDS = 30
+INDEX_CACHE_MAXSIZE = 256
+_index_cache: dict[tuple, tuple[float, Dict]] = {}
+
+# Equal weights across all 8 categories (the baseline index)
+DEFAULT_WEIGHTS = {
+    'capabilities': 0.125,
+    'agents': 0.125,
+    'inputs': 0.125,
+    'security': 0.125,
+    'economic': 0.125,
+    'research': 0.125,
+    'geopolitical': 0.125,
+    'safety_incidents': 0.125
+}
+
+
+def clear_progress_index_cache() -> None:
+    """Drop memoized index results (call after signpost data changes)."""
+    _index_cache.clear()
+
 
 def normalize_signpost_progress(signpost: Signpost) -> float:
     """
@@ -85,19 +113,10 @@ def compute_progress_index(
     
     # Default to equal weights
     if weights is None:
-        weights = {
-            'capabilities': 0.125,
-            'agents': 0.125,
-            'inputs': 0.125,
-            'security': 0.125,
-            'economic': 0.125,
-            'research': 0.125,
-            'geopolitical': 0.125,
-            'safety_incidents': 0.125
-        }
+        weights = DEFAULT_WEIGHTS
     
-    # Normalize weights to sum to 1.0
-    total_weight = sum(weights.values())
+    # Normalize weights to sum to 1.0 (fsum: exactly rounded total)
+    total_weight = math.fsum(weights.values())
     if total_weight > 0:
         weights = {k: v / total_weight for k, v in weights.items()}
     
@@ -107,8 +126,8 @@ def compute_progress_index(
         score = compute_dimension_score(category, db)
         components[category] = round(score * 100, 2)  # Convert to 0-100
     
-    # Weighted average
-    composite_value = sum(
+    # Weighted average, summed without accumulated rounding error
+    composite_value = math.fsum(
         components[cat] * weights[cat]
         for cat in components.keys()
     )
@@ -120,3 +139,55 @@ def compute_progress_index(
         'as_of': date.today().isoformat()
     }
 
+
+def _index_cache_key(db: Session, weights: Optional[Dict[str, float]]) -> tuple:
+    """
+    Cache key for a weight vector read through db's bind, after the same
+    normalization compute_progress_index applies.
+    
+    The bind (engine, or connection for sessions bound to one) keeps
+    results from different databases or test transactions apart. Vectors
+    that normalize identically (e.g. the default equal weights, whether
+    passed explicitly, scaled, or as None) share one entry.
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    
+    total_weight = math.fsum(weights.values())
+    if total_weight > 0:
+        normalized = tuple(sorted((k, v / total_weight) for k, v in weights.items()))
+    else:
+        normalized = tuple(sorted(weights.items()))
+    return (db.get_bind(), normalized)
+
+
+def compute_progress_index_cached(
+    db: Session,
+    weights: Optional[Dict[str, float]] = None
+) -> Dict:
+    """
+    compute_progress_index memoized per database bind and weight vector.
+    
+    Results are reused for INDEX_CACHE_TTL_SECONDS; at most
+    INDEX_CACHE_MAXSIZE weight vectors are kept (oldest evicted first).
+    Weight vectors are keyed after normalization, so a request for the
+    baseline weights reuses the baseline result.
+    
+    Returns:
+        A copy of the cached result, safe for the caller to modify
+    """
+    key = _index_cache_key(db, weights)
+    now = time.monotonic()
+    
+    hit = _index_cache.get(key)
+    if hit is not None and now - hit[0] < INDEX_CACHE_TTL_SECONDS:
+        return deepcopy(hit[1])
+    
+    result = compute_progress_index(db, weights=weights)
+    
+    _index_cache.pop(key, None)
+    if len(_index_cache) >= INDEX_CACHE_MAXSIZE:
+        _index_cache.pop(next(iter(_index_cache)))
+    _index_cache[key] = (now, result)
+    
+    return deepcopy(result)
@@ -6,7 +6,7 @@ from sqlalchemy import case, func
 
 from app.database import SessionLocal
 from app.models import Event, SourceCredibilitySnapshot
-from app.utils.statistics import credibility_tier, wilson_lower_bound
+from app.utils.statistics import credibility_tier, wilson_lower_bound_batch
 
 
 @shared_task(name="app.tasks.credibility.snapshot_source_credibility")
@@ -55,16 +55,21 @@ def snapshot_source_credibility() -> dict:
         snapshots_created = 0
         min_volume = 5
 
-        for row in results:
-            if not row.publisher or row.total_events < min_volume:
-                continue
-
-            retracted = row.retracted_count or 0
-            total = row.total_events
-            successes = total - retracted
-
-            # Calculate Wilson score
-            wilson_score = wilson_lower_bound(successes, total, confidence=0.95)
+        rows = [
+            row for row in results
+            if row.publisher and row.total_events >= min_volume
+        ]
+
+        # Calculate Wilson scores for all publishers in one vectorized pass
+        totals = [row.total_events for row in rows]
+        retracted_counts = [row.retracted_count or 0 for row in rows]
+        wilson_scores = wilson_lower_bound_batch(
+            [total - retracted for total, retracted in zip(totals, retracted_counts)],
+            totals,
+            confidence=0.95
+        )
+
+        for row, total, retracted, wilson_score in zip(rows, totals, retracted_counts, wilson_scores.tolist()):
             tier = credibility_tier(wilson_score, total)
             retraction_rate = retracted / total if total > 0 else 0.0
 
@@ -3,6 +3,7 @@
 import redis.asyncio as aioredis
 
 from app.config import settings
+from app.services.progress_index import clear_progress_index_cache
 
 
 async def invalidate_signpost_caches(signpost_ids: list[int]) -> int:
@@ -28,6 +29,9 @@ async def invalidate_signpost_caches(signpost_ids: list[int]) -> int:
     if not signpost_ids:
         return 0
 
+    # In-process memoized index results depend on signpost data too
+    clear_progress_index_cache()
+
     redis_client = await aioredis.from_url(
         settings.redis_url,
         encoding="utf-8",
@@ -8,6 +8,8 @@ import re
 from typing import List, Optional
 from fastapi_cache import FastAPICache
 
+from app.services.progress_index import clear_progress_index_cache
+
 
 async def invalidate_cache_patterns(patterns: List[str]):
     """
@@ -20,6 +22,7 @@ async def invalidate_cache_patterns(patterns: List[str]):
     # so we need to implement it
     # For now, we clear all cache (future: implement pattern matching)
     await FastAPICache.clear()
+    clear_progress_index_cache()
     print(f"✅ Cache invalidated (patterns: {patterns})")
 
 
@@ -79,5 +82,6 @@ async def invalidate_all():
     Use sparingly (e.g., after major data imports or schema changes).
     """
     await FastAPICache.clear()
+    clear_progress_index_cache()
     print("🔥 All caches cleared")
 
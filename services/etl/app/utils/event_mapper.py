@@ -10,10 +10,19 @@ Policy:
 """
 import re
 from datetime import UTC
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+try:
+    # Optional: RE2 gives linear-time (DFA) matching for the alias patterns
+    import re2
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.case_sensitive = False
+except ImportError:
+    re2 = None
+
 ALIASES_PATH = Path(__file__).parent.parent.parent.parent.parent / "infra" / "seeds" / "aliases_signposts.yaml"
 
 
@@ -25,93 +34,221 @@ def load_aliases() -> dict:
         return yaml.safe_load(f) or {}
 
 
-def match_aliases(text: str, aliases: dict, max_signposts: int = 5) -> list[tuple[str, float, str]]:
-    """
-    Match text against alias patterns and return (code, confidence, rationale) tuples.
+def _compile_alias_pattern(pattern: str):
+    """Compile a case-insensitive alias pattern, preferring RE2 when installed."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, _RE2_OPTIONS)
+        except re2.error:
+            # Lookarounds/backreferences are not supported by RE2
+            pass
+    return re.compile(pattern, re.IGNORECASE)
 
-    Returns up to max_signposts per event (default 5, increased from 2 to capture
-    more connections between events and signposts).
+
+def compile_aliases(aliases: dict) -> tuple[tuple[re.Pattern, tuple[str, ...], float], ...]:
     """
-    text_lower = text.lower()
-    matches = []
-    seen_codes = set()
+    Flatten the alias registry into a tuple of (compiled pattern, codes, boost) rules.
 
-    # Aliases structure: {category: [{pattern, codes, boost}, ...]}
-    for category, rules in aliases.items():
-        if not isinstance(rules, list):
+    Aliases structure: {category: [{pattern, codes, boost}, ...]}. Patterns are
+    compiled once here (case-insensitive, with RE2 when available); malformed
+    rules and invalid regexes are dropped here once rather than re-checked per
+    event.
+    """
+    rules = []
+    for category_rules in aliases.values():
+        if not isinstance(category_rules, list):
             continue
-        for rule in rules:
+        for rule in category_rules:
             if not isinstance(rule, dict):
                 continue
-            pattern = rule.get("pattern", "")
-            codes = rule.get("codes", [])
-            boost = rule.get("boost", 0.0)
-
-            # Check if pattern matches
             try:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    for code in codes:
-                        if code not in seen_codes:
-                            base_conf = 0.5 + boost
-                            rationale = f"Alias match: '{pattern}'"
-                            matches.append((code, base_conf, rationale))
-                            seen_codes.add(code)
+                pattern = _compile_alias_pattern(rule.get("pattern", ""))
             except re.error:
                 # Invalid regex; skip
                 continue
+            rules.append((
+                pattern,
+                tuple(rule.get("codes", [])),
+                rule.get("boost", 0.0),
+            ))
+    return tuple(rules)
+
+
+def compile_alias_prefilter(rules: tuple):
+    """
+    Fuse every rule's pattern into one alternation used as a prefilter.
+
+    The union matches iff at least one rule matches, so a single scan can
+    rule out events that hit no alias at all. Returns None if the fused
+    pattern can't be compiled.
+    """
+    if not rules:
+        return None
+    union = "|".join(f"(?:{pattern.pattern})" for pattern, _codes, _boost in rules)
+    try:
+        return _compile_alias_pattern(union)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=1)
+def default_alias_rules() -> tuple[tuple[re.Pattern, tuple[str, ...], float], ...]:
+    """Load and flatten the alias registry once per process."""
+    return compile_aliases(load_aliases())
+
+
+@lru_cache(maxsize=1)
+def default_alias_prefilter():
+    """Fused prefilter for the default alias rules, built once per process."""
+    return compile_alias_prefilter(default_alias_rules())
+
+
+# Single pass over the text; each alternative fills one field of the result.
+_NUMERIC_RE = re.compile(
+    r"(?P<pct>\d+(?:\.\d+)?)\s*%"
+    r"|(?:10\^|1e)(?P<flops>\d+)"
+    r"|(?P<gw>\d+(?:\.\d+)?)\s*GW",
+    re.IGNORECASE,
+)
+
+
+def extract_numeric_values(text: str) -> dict:
+    """
+    Extract percentage, FLOP exponent and power (GW) figures from text.
+
+    Scans once with a combined regex; the first hit for each field wins and
+    the scan stops as soon as all three fields are filled.
+
+    Returns:
+        Dict with "percentage", "flops_exponent" and "power_gw" (None if absent)
+    """
+    values = {"percentage": None, "flops_exponent": None, "power_gw": None}
+    remaining = 3
+    for match in _NUMERIC_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "pct" and values["percentage"] is None:
+            values["percentage"] = float(match.group("pct"))
+        elif kind == "flops" and values["flops_exponent"] is None:
+            values["flops_exponent"] = int(match.group("flops"))
+        elif kind == "gw" and values["power_gw"] is None:
+            values["power_gw"] = float(match.group("gw"))
+        else:
+            continue
+        remaining -= 1
+        if not remaining:
+            break
+    return values
+
+
+def match_aliases(
+    text: str,
+    aliases: dict | tuple,
+    max_signposts: int = 5,
+    prefilter=None,
+) -> list[tuple[str, float, str]]:
+    """
+    Match text against alias patterns and return (code, confidence, rationale) tuples.
+
+    aliases may be the raw registry dict or rules from compile_aliases().
+    prefilter, if given, is the fused pattern from compile_alias_prefilter();
+    text it doesn't match is rejected without trying each rule.
+    Returns up to max_signposts per event (default 5, increased from 2 to capture
+    more connections between events and signposts).
+    """
+    if prefilter is not None and not prefilter.search(text):
+        return []
+    rules = compile_aliases(aliases) if isinstance(aliases, dict) else aliases
+    matches = []
+    seen_codes = set()
+
+    for pattern, codes, boost in rules:
+        # Check if pattern matches (patterns are compiled case-insensitive)
+        if pattern.search(text):
+            for code in codes:
+                if code not in seen_codes:
+                    base_conf = 0.5 + boost
+                    rationale = f"Alias match: '{pattern.pattern}'"
+                    matches.append((code, base_conf, rationale))
+                    seen_codes.add(code)
 
     # Sort by confidence (descending) and cap to max_signposts
     matches.sort(key=lambda x: x[1], reverse=True)
     return matches[:max_signposts]
 
 
-def map_event_to_signposts(event, aliases: dict = None) -> list[tuple[str, float, str]]:
+def map_event_to_signposts(event, aliases: dict | tuple = None) -> list[tuple[str, float, str]]:
     """
     Map event to signposts using alias registry.
 
     Args:
         event: Event object or dict with title/summary
-        aliases: Optional pre-loaded alias dict
+        aliases: Optional pre-loaded alias dict or compiled rules; defaults
+            to the registry loaded once per process
 
     Returns:
         List of (signpost_code, confidence, tier) tuples
     """
+    prefilter = None
     if aliases is None:
-        aliases = load_aliases()
+        aliases = default_alias_rules()
+        prefilter = default_alias_prefilter()
 
     # Combine title and summary for matching
     text = f"{event.get('title', '')} {event.get('summary', '')}" if isinstance(event, dict) else f"{event.title} {event.summary or ''}"
 
     # Match aliases
-    candidates = match_aliases(text, aliases)
+    candidates = match_aliases(text, aliases, prefilter=prefilter)
 
     # Add tier from event
     tier = event.get("evidence_tier") if isinstance(event, dict) else getattr(event, "evidence_tier", "D")
 
     results = []
     for code, conf, rationale in candidates:
-        # Apply tier adjustments (A gets +0.1, B gets +0.05, C/D get 0)
-        if tier == "A":
-            conf += 0.1
-        elif tier == "B":
-            conf += 0.05
-        # C and D get no boost (and will never move gauges anyway)
+        results.append((code, calculate_final_confidence(conf, False, False, tier), tier))
 
-        # Cap at 0.95
-        conf = min(conf, 0.95)
+    return results
 
-        results.append((code, conf, tier))
 
-    return results
+# A gets +0.1, B gets +0.05; C/D get no boost (and never move gauges anyway)
+_TIER_BOOST = {"A": 0.1, "B": 0.05, "C": 0.0, "D": 0.0}
+_NUMERIC_BOOST = 0.2
+_MULTIPLE_BOOST = 0.15
+_CONFIDENCE_CAP = 0.95
+
+
+@lru_cache(maxsize=256)
+def calculate_final_confidence(base: float, has_numeric: bool, multiple: bool, tier: str) -> float:
+    """
+    Apply tier, numeric-evidence and multi-match boosts to a base confidence.
+
+    Pure over a small argument space, so results are memoized per process.
+
+    Args:
+        base: Confidence from alias matching
+        has_numeric: Event text carries a numeric figure (+0.2)
+        multiple: Several independent matches support the link (+0.15)
+        tier: Evidence tier (A gets +0.1, B gets +0.05, C/D get 0)
+
+    Returns:
+        Final confidence, capped at 0.95
+    """
+    conf = base + _TIER_BOOST.get(tier, 0.0)
+    if has_numeric:
+        conf += _NUMERIC_BOOST
+    if multiple:
+        conf += _MULTIPLE_BOOST
+    return min(conf, _CONFIDENCE_CAP)
+
+
+# C/D always need review (they're "if true" only); A/B below the threshold do
+_ALWAYS_REVIEW_TIERS = frozenset({"C", "D"})
+_REVIEW_THRESHOLD = 0.6
 
 
+@lru_cache(maxsize=256)
 def needs_review(confidence: float, tier: str) -> bool:
     """Determine if event needs manual review based on confidence and tier."""
-    # C/D always need review (they're "if true" only)
-    if tier in ("C", "D"):
-        return True
-    # A/B need review if confidence < 0.6
-    return confidence < 0.6
+    return tier in _ALWAYS_REVIEW_TIERS or confidence < _REVIEW_THRESHOLD
 
 
 def map_all_unmapped_events() -> dict:
@@ -139,7 +276,7 @@ def map_all_unmapped_events() -> dict:
         ).all()
 
         print(f"📍 Mapping {len(events)} unmapped events to signposts...")
-        aliases = load_aliases()
+        aliases = default_alias_rules()
 
         # Get all signpost codes for LLM
         all_signpost_codes = [sp.code for sp in db.query(Signpost.code).all()]
@@ -3,7 +3,7 @@ import hashlib
 import json
 from collections.abc import Callable
 from datetime import UTC, datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any
 
 import structlog
@@ -23,8 +23,9 @@ MODEL_COSTS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def calculate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
-    """Calculate cost in USD for an LLM call."""
+    """Calculate cost in USD for an LLM call (memoized; MODEL_COSTS is static)."""
     costs = MODEL_COSTS.get(model, {"prompt": 0.0, "completion": 0.0})
     prompt_cost = (prompt_tokens / 1_000_000) * costs["prompt"]
     completion_cost = (completion_tokens / 1_000_000) * costs["completion"]
@@ -1,7 +1,37 @@
 """Scraper utility functions for respectful web scraping."""
+import time
 import urllib.robotparser
 from urllib.parse import urlparse
 
+# Parsed robots.txt per robots URL, refetched once older than the TTL
+ROBOTS_CACHE_TTL_SECONDS = 3600
+_robots_cache: dict[str, urllib.robotparser.RobotFileParser] = {}
+
+
+def _reset_cache() -> None:
+    """Drop cached robots.txt parsers (for tests that need a fresh fetch)."""
+    _robots_cache.clear()
+
+
+def _get_robots_parser(robots_url: str) -> urllib.robotparser.RobotFileParser:
+    """Return a parsed robots.txt, fetching it only when missing or stale."""
+    rp = _robots_cache.get(robots_url)
+    if rp is not None and time.time() - rp.mtime() < ROBOTS_CACHE_TTL_SECONDS:
+        return rp
+
+    rp = urllib.robotparser.RobotFileParser()
+    rp.set_url(robots_url)
+    rp.read()
+    if not rp.mtime():
+        # read() skips parse() (and the timestamp) on HTTP errors. Only the
+        # allow-all 4xx case is safe to cache; 401/403 and 5xx leave the
+        # parser unchecked (can_fetch is False) and are retried next time.
+        if not rp.allow_all:
+            return rp
+        rp.modified()
+    _robots_cache[robots_url] = rp
+    return rp
+
 
 def get_user_agent() -> str:
     """
@@ -22,15 +52,14 @@ def check_robots_txt(url: str) -> bool:
     Returns:
         True if allowed, False if disallowed
 
-    Note: Returns True if robots.txt cannot be fetched (permissive fallback)
+    Note: Returns True if robots.txt cannot be fetched (permissive fallback).
+    Parsed robots.txt files are cached per host for ROBOTS_CACHE_TTL_SECONDS.
     """
     try:
         parsed = urlparse(url)
         robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
 
-        rp = urllib.robotparser.RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
+        rp = _get_robots_parser(robots_url)
 
         user_agent = get_user_agent()
         is_allowed = rp.can_fetch(user_agent, url)
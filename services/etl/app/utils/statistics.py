@@ -1,6 +1,11 @@
 """Statistical utilities for credibility scoring."""
 import math
 
+import numpy as np
+
+# Two-sided z-scores by confidence level (e.g. 0.95 -> 97.5th percentile)
+Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+
 
 def wilson_score_interval(
     successes: int,
@@ -39,7 +44,7 @@ def wilson_score_interval(
 
     # For confidence=0.95, z=1.96 (97.5th percentile of normal distribution)
     # For confidence=0.99, z=2.576
-    z = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}.get(confidence, 1.96)
+    z = Z_SCORES.get(confidence, 1.96)
 
     phat = successes / total
     denominator = 1 + z**2 / total
@@ -80,6 +85,46 @@ def wilson_lower_bound(successes: int, total: int, confidence: float = 0.95) ->
     return lower
 
 
+def wilson_lower_bound_batch(
+    successes: np.ndarray,
+    totals: np.ndarray,
+    confidence: float = 0.95
+) -> np.ndarray:
+    """
+    Vectorized Wilson lower bound for many publishers at once.
+
+    Same formula as wilson_lower_bound, evaluated with NumPy over whole
+    arrays instead of one Python call per publisher.
+
+    Args:
+        successes: Array of successful outcomes per publisher
+        totals: Array of total trials per publisher
+        confidence: Confidence level
+
+    Returns:
+        Array of lower bounds (0.0 where total is 0)
+
+    Example:
+        scores = wilson_lower_bound_batch([95, 9], [100, 10])
+        # array([0.887..., 0.596...])
+    """
+    successes = np.asarray(successes, dtype=float)
+    totals = np.asarray(totals, dtype=float)
+    z = Z_SCORES.get(confidence, 1.96)
+
+    # Zero totals divide by zero here; they are masked to 0.0 below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        phat = successes / totals
+        denominator = 1 + z**2 / totals
+        centre = (phat + z**2 / (2 * totals)) / denominator
+        margin = z * np.sqrt(
+            (phat * (1 - phat) + z**2 / (4 * totals)) / totals
+        ) / denominator
+        lower = np.maximum(0.0, centre - margin)
+
+    return np.where(totals == 0, 0.0, lower)
+
+
 def credibility_tier(score: float, volume: int) -> str:
     """
     Assign credibility tier based on Wilson score and volume.
@@ -6,12 +6,22 @@ Validates infra/seeds/signposts_comprehensive_v2.yaml against schema requirement
 Exits non-zero on any validation failure.
 
 Used in CI to block PRs with malformed seed data.
+
+Can optionally be compiled with Cython for faster validation:
+    AGITRACKER_CYTHONIZE=true python setup.py build_ext --inplace
 """
 
+import argparse
+import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
 from pathlib import Path
 import yaml
-from datetime import datetime
+from datetime import date
 from decimal import Decimal, InvalidOperation
 
 # Validation constants
@@ -25,20 +35,47 @@ DATE_FIELDS = {
     'aschenbrenner_timeline', 'ai2027_timeline', 'cotra_timeline',
     'epoch_timeline', 'openai_prep_timeline', 'current_sota_date'
 }
+CONFIDENCE_FIELDS = (
+    'aschenbrenner_confidence', 'ai2027_confidence',
+    'cotra_confidence', 'epoch_confidence', 'openai_prep_confidence'
+)
+NUMERIC_FIELDS = ('baseline_value', 'target_value', 'current_sota_value')
+# Below this many signposts, process start-up costs more than it saves
+PARALLEL_MIN_SIGNPOSTS = 1000
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# From services/etl/app/validation/ go up 4 levels to repo root
+SEED_PATH = Path(__file__).parent.parent.parent.parent.parent / "infra" / "seeds" / "signposts_comprehensive_v2.yaml"
+
 
+@lru_cache(maxsize=512)
+def _parse_iso_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD string.
 
-def validate_date(value, field_name):
+    Cached because timeline dates repeat heavily across signposts.
+    """
+    if not DATE_PATTERN.match(value):
+        raise ValueError("does not match format YYYY-MM-DD")
+    return date.fromisoformat(value)
+
+
+def validate_date(value: str | None, field_name: str) -> str | None:
     """Validate date format YYYY-MM-DD."""
     if value is None:
         return None
     try:
-        datetime.strptime(value, "%Y-%m-%d")
+        _parse_iso_date(value)
         return None  # Valid
     except ValueError as e:
         return f"Invalid date format in {field_name}: {value} ({e})"
 
 
-def validate_numeric(value, field_name, min_val=None, max_val=None):
+def validate_numeric(
+    value: object,
+    field_name: str,
+    min_val: int | None = None,
+    max_val: int | None = None
+) -> str | None:
     """Validate numeric field."""
     if value is None:
         return None
@@ -53,7 +90,27 @@ def validate_numeric(value, field_name, min_val=None, max_val=None):
         return f"Invalid numeric value in {field_name}: {value} ({e})"
 
 
-def validate_signpost(sp_data, code):
+def _compile_field_checks():
+    """
+    Bind every optional field to its checker once, at import time.
+    
+    Returns: Dict of field -> check, where check(value) returns an error
+    message or None.
+    """
+    checks = {}
+    for field in CONFIDENCE_FIELDS:
+        checks[field] = partial(validate_numeric, field_name=field, min_val=0, max_val=1)
+    for field in DATE_FIELDS:
+        checks[field] = partial(validate_date, field_name=field)
+    for field in NUMERIC_FIELDS:
+        checks[field] = partial(validate_numeric, field_name=field)
+    return checks
+
+
+_FIELD_CHECKS = _compile_field_checks()
+
+
+def validate_signpost(sp_data: dict, code: str) -> list[str]:
     """
     Validate a single signpost.
     
@@ -85,97 +142,160 @@ def validate_signpost(sp_data, code):
         if direction not in ('>=', None):
             errors.append(f"Binary signposts should use direction='>=', got {direction}")
     
-    # Validate confidence ranges (0-1)
-    confidence_fields = [
-        'aschenbrenner_confidence', 'ai2027_confidence', 
-        'cotra_confidence', 'epoch_confidence', 'openai_prep_confidence'
-    ]
-    for field in confidence_fields:
-        if field in sp_data and sp_data[field] is not None:
-            err = validate_numeric(sp_data[field], field, min_val=0, max_val=1)
-            if err:
-                errors.append(err)
-    
-    # Validate date formats
-    for field in DATE_FIELDS:
-        if field in sp_data and sp_data[field] is not None:
-            err = validate_date(sp_data[field], field)
-            if err:
-                errors.append(err)
-    
-    # Validate numeric fields
-    numeric_fields = ['baseline_value', 'target_value', 'current_sota_value']
-    for field in numeric_fields:
-        if field in sp_data and sp_data[field] is not None:
-            err = validate_numeric(sp_data[field], field)
-            if err:
-                errors.append(err)
+    # Validate confidence ranges (0-1), date formats and numeric fields in
+    # a single sweep over the signpost's own keys
+    for field, value in sp_data.items():
+        if value is None:
+            continue
+        check = _FIELD_CHECKS.get(field)
+        if check is None:
+            continue
+        err = check(value)
+        if err:
+            errors.append(err)
     
     return errors
 
 
-def main():
-    """Main validation entry point."""
+def _validate_category(category, signposts, verbose=False, repeat_indices=frozenset()):
+    """
+    Validate all signposts in one category.
+    
+    Per-signpost success lines are only emitted when verbose is set.
+    
+    repeat_indices holds the positions (within this category) of codes
+    already seen earlier in the file, computed once up front by
+    validate_seed_data. Those are flagged as duplicates and not validated
+    again; the first occurrence is validated normally.
     
-    # Find seed file (from services/etl/app/validation/ go up 4 levels to repo root)
-    yaml_path = Path(__file__).parent.parent.parent.parent.parent / "infra" / "seeds" / "signposts_comprehensive_v2.yaml"
+    Returns: (output lines, error messages) so categories can be
+    validated in separate processes and merged by the caller.
+    """
+    lines = [f"\n📊 Validating {category}: {len(signposts)} signposts"]
+    errors = []
+    
+    for i, sp_data in enumerate(signposts):
+        code = sp_data.get('code', 'UNKNOWN')
+        
+        # Check for duplicate codes
+        if i in repeat_indices:
+            error = f"[{code}] Duplicate code in YAML"
+            lines.append(f"  ❌ {error}")
+            errors.append(error)
+            continue
+        
+        # Validate signpost
+        sp_errors = validate_signpost(sp_data, code)
+        if sp_errors:
+            for err in sp_errors:
+                error_msg = f"[{code}] {err}"
+                lines.append(f"  ❌ {error_msg}")
+                errors.append(error_msg)
+        elif verbose:
+            lines.append(f"  ✓ {code}")
+    
+    return lines, errors
+
+
+def _load_seed_yaml(yaml_path):
+    """Parse the seed YAML (with the libyaml safe loader when available)."""
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(yaml_path) as f:
+        return yaml.load(f, Loader=loader)
+
+
+def main(argv=None) -> int:
+    """
+    Main validation entry point.
+    
+    Returns: Process exit code (0 if all signposts are valid)
+    """
+    
+    parser = argparse.ArgumentParser(description="Validate signpost seed data.")
+    parser.add_argument(
+        "--verbose", "-v", action="store_true",
+        help="Print a line for every valid signpost, not just errors"
+    )
+    args = parser.parse_args(argv)
+    
+    yaml_path = SEED_PATH
     
     if not yaml_path.exists():
         print(f"❌ Seed file not found: {yaml_path}")
-        sys.exit(1)
+        return 1
     
     print(f"📖 Validating: {yaml_path}")
     
     # Load YAML
     try:
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+        data = _load_seed_yaml(yaml_path)
     except Exception as e:
         print(f"❌ Failed to parse YAML: {e}")
-        sys.exit(1)
+        return 1
     
-    # Track validation results
-    total_signposts = 0
+    return validate_seed_data(data, verbose=args.verbose)
+
+
+def validate_seed_data(data: dict, verbose: bool = False) -> int:
+    """
+    Validate already-parsed seed data and print the report.
+    
+    Lets callers that already hold the parsed YAML (e.g. tests) skip
+    re-reading the seed file.
+    
+    Returns: Process exit code (0 if all signposts are valid)
+    """
+    categories = [c for c in sorted(ALLOWED_CATEGORIES) if c in data]
+    signpost_lists = [data[c] for c in categories]
+    
+    # One sweep in category order finds every repeat occurrence (within or
+    # across categories) before the validation loop runs
+    code_counts = Counter()
+    repeat_indices = []
+    for signposts in signpost_lists:
+        repeats = set()
+        for i, sp_data in enumerate(signposts):
+            code = sp_data.get('code', 'UNKNOWN')
+            if code in code_counts:
+                repeats.add(i)
+            code_counts[code] += 1
+        repeat_indices.append(frozenset(repeats))
+    total_signposts = sum(code_counts.values())
+    
+    # Validate each category (independent, so large seed files fan out
+    # across worker processes)
+    if total_signposts >= PARALLEL_MIN_SIGNPOSTS:
+        workers = min(len(categories), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = dict(zip(categories, pool.map(
+                _validate_category, categories, signpost_lists,
+                repeat(verbose), repeat_indices
+            )))
+    else:
+        results = dict(zip(categories, map(
+            _validate_category, categories, signpost_lists,
+            repeat(verbose), repeat_indices
+        )))
+    
+    # Merge per-category results in category order
     total_errors = []
-    codes_seen = set()
     
-    # Validate each category
     for category in sorted(ALLOWED_CATEGORIES):
-        if category not in data:
+        if category not in results:
             print(f"⚠️  Category '{category}' not found in seed file")
             continue
         
-        signposts = data[category]
-        print(f"\n📊 Validating {category}: {len(signposts)} signposts")
-        
-        for sp_data in signposts:
-            code = sp_data.get('code', 'UNKNOWN')
-            total_signposts += 1
-            
-            # Check for duplicate codes
-            if code in codes_seen:
-                error = f"[{code}] Duplicate code in YAML"
-                print(f"  ❌ {error}")
-                total_errors.append(error)
-                continue
-            codes_seen.add(code)
-            
-            # Validate signpost
-            errors = validate_signpost(sp_data, code)
-            if errors:
-                for err in errors:
-                    error_msg = f"[{code}] {err}"
-                    print(f"  ❌ {error_msg}")
-                    total_errors.append(error_msg)
-            else:
-                print(f"  ✓ {code}")
+        # One write per category instead of one print per signpost
+        lines, errors = results[category]
+        sys.stdout.write("\n".join(lines) + "\n")
+        total_errors.extend(errors)
     
     # Print summary
     print(f"\n{'='*60}")
     print(f"📊 VALIDATION SUMMARY")
     print(f"{'='*60}")
     print(f"Total signposts: {total_signposts}")
-    print(f"Unique codes: {len(codes_seen)}")
+    print(f"Unique codes: {len(code_counts)}")
     print(f"Errors found: {len(total_errors)}")
     
     if total_errors:
@@ -184,12 +304,12 @@ def main():
             print(f"  - {error}")
         if len(total_errors) > 20:
             print(f"  ... and {len(total_errors) - 20} more errors")
-        sys.exit(1)
-    else:
-        print(f"\n✅ VALIDATION PASSED - All {total_signposts} signposts are valid")
-        sys.exit(0)
+        return 1
+    
+    print(f"\n✅ VALIDATION PASSED - All {total_signposts} signposts are valid")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
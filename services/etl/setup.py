@@ -1,9 +1,31 @@
-from setuptools import find_packages, setup
+import os
+
+from setuptools import Extension, find_packages, setup
+
+ext_modules = []
+
+# Optional: compile the seed validator to a C extension with Cython.
+# The compiled module shadows the .py file on import; without it the
+# pure-Python validator is used unchanged.
+if os.getenv("AGITRACKER_CYTHONIZE", "false").lower() == "true":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            Extension(
+                "app.validation.validate_signposts",
+                ["app/validation/validate_signposts.py"],
+            )
+        ],
+        language_level=3,
+        compiler_directives={"boundscheck": False},
+        build_dir="build",
+    )
 
 setup(
     name="agi-tracker-etl",
     version="0.1.0",
     packages=find_packages(),
     install_requires=[],
+    ext_modules=ext_modules,
 )
-
@@ -5,21 +5,16 @@ Tests that admin actions are properly logged to audit_logs table.
 Verifies both success and failure paths.
 """
 
+import ast
+import inspect
+
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy import text
 
-from app.main import app
 from app.database import SessionLocal
 from app.models import AuditLog
 
 
-@pytest.fixture
-def client():
-    """Test client for API requests."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def db():
     """Database session for verification."""
@@ -28,7 +23,7 @@ def db():
     session.close()
 
 
-def test_admin_action_logs_success(client, db):
+def test_admin_action_logs_success(app_client, db):
     """
     Test that successful admin actions write audit logs.
     
@@ -43,7 +38,7 @@ def test_admin_action_logs_success(client, db):
     # Note: This requires a test API key to exist in the database
     # For now, we'll test the logging mechanism exists even if auth fails
     
-    response = client.post(
+    response = app_client.post(
         "/v1/admin/events/1/retract",
         headers={"X-API-Key": "test-key-not-real"},
         json={"reason": "test retraction"}
@@ -99,21 +94,29 @@ def test_audit_logging_function_exists():
     assert 'actor' in params, "log_admin_action should accept actor"
 
 
+def _count_calls(module, func) -> int:
+    """Count call sites in module that resolve to func, following import aliases."""
+    names = {name for name, value in vars(module).items() if value is func}
+    tree = ast.parse(inspect.getsource(module))
+    return sum(
+        1
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in names
+    )
+
+
 def test_admin_router_imports_audit():
     """Verify admin router imports and uses audit logging."""
     
-    # Read admin router file
-    import os
-    router_path = os.path.join(os.path.dirname(__file__), '..', 'app', 'routers', 'admin.py')
-    
-    with open(router_path) as f:
-        content = f.read()
+    import app.routers.admin as admin_router
+    from app.utils.audit import log_admin_action
     
-    # Should import log_admin_action
-    assert 'from app.utils.audit import log_admin_action' in content, \
+    # Should import log_admin_action (under any alias)
+    assert any(value is log_admin_action for value in vars(admin_router).values()), \
         "Admin router must import log_admin_action"
     
     # Should have multiple calls to log_admin_action
-    call_count = content.count('log_admin_action(')
+    call_count = _count_calls(admin_router, log_admin_action)
     assert call_count >= 4, f"Expected at least 4 log_admin_action calls, found {call_count}"
-
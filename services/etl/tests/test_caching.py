@@ -46,12 +46,12 @@ def test_etag_varies_by_preset():
 
 
 def test_etag_format():
-    """Test that ETag is a valid MD5 hash."""
+    """Test that ETag is a valid 128-bit BLAKE2b hash."""
     content = '{"test": "data"}'
     etag = generate_etag(content, "equal")
     
-    # MD5 hash is 32 characters hex
-    assert len(etag) == 32, "ETag should be 32 characters (MD5 hash)"
+    # 16-byte BLAKE2b digest is 32 characters hex
+    assert len(etag) == 32, "ETag should be 32 characters (BLAKE2b-128 hash)"
     assert all(c in "0123456789abcdef" for c in etag), "ETag should be hexadecimal"
 
 
@@ -67,6 +67,15 @@ def test_etag_deterministic():
     assert len(set(etags)) == 1, "ETag generation should be deterministic"
 
 
+def test_etag_dict_matches_canonical_bytes():
+    """Dict content hashes the same regardless of key order."""
+    etag_dict = generate_etag({"b": 2, "a": 1}, "equal")
+    etag_reordered = generate_etag({"a": 1, "b": 2}, "equal")
+    etag_bytes = generate_etag(b'{"a":1,"b":2}', "equal")
+    
+    assert etag_dict == etag_reordered == etag_bytes
+
+
 def test_etag_changes_with_content():
     """
     Test that ETag changes when content changes (simulates cache purge effect).
@@ -86,9 +95,4 @@ def test_etag_changes_with_content():
 
 
 if __name__ == "__main__":
-    test_etag_varies_by_preset()
-    test_etag_format()
-    test_etag_deterministic()
-    test_etag_changes_with_content()
-    print("✅ All caching tests passed")
-
+    pytest.main([__file__, "-v"])
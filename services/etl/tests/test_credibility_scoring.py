@@ -1,8 +1,10 @@
 """Unit tests for Wilson interval credibility scoring."""
+import numpy as np
 import pytest
 from app.utils.statistics import (
     wilson_score_interval,
     wilson_lower_bound,
+    wilson_lower_bound_batch,
     credibility_tier,
     laplace_smoothing
 )
@@ -55,6 +57,23 @@ class TestWilsonInterval:
         
         # This is the key property we want!
         # Low-volume publisher with same rate gets more conservative score
+    
+    def test_wilson_batch_matches_scalar(self):
+        """Vectorized lower bound matches the scalar version across a sweep."""
+        totals = np.repeat([0, 1, 5, 10, 50, 100], 101)
+        successes = np.minimum(np.tile(np.arange(101), 6), totals)
+        
+        batch = wilson_lower_bound_batch(successes, totals)
+        
+        expected = [wilson_lower_bound(int(s), int(t)) for s, t in zip(successes, totals)]
+        np.testing.assert_allclose(batch, expected)
+    
+    def test_wilson_batch_zero_total(self):
+        """Zero totals yield 0.0 without NaNs or warnings."""
+        scores = wilson_lower_bound_batch([0, 9], [0, 10])
+        
+        assert scores[0] == 0.0
+        assert not np.isnan(scores).any()
 
 
 class TestCredibilityTier:
@@ -4,8 +4,9 @@ Dashboard API tests - BLOCKING in CI.
 Tests read-only dashboard endpoints for FiveThirtyEight-style homepage.
 """
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 from datetime import datetime, timedelta
 
 from app.main import app
@@ -14,10 +15,21 @@ from app.models import Event, Signpost
 from app.schemas.dashboard import HomepageSnapshot, Timeseries, NewsItem
 
 
-@pytest.fixture
-def client():
-    """Test client for API requests."""
-    return TestClient(app)
+# Share one event loop (and therefore one client) across the module
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    Async client driving the ASGI app in-process.
+    
+    Avoids TestClient's per-request thread hop; one client is reused for
+    the whole session.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
 
 
 @pytest.fixture
@@ -28,18 +40,18 @@ def db():
     session.close()
 
 
-def test_dashboard_summary_returns_200(client):
+async def test_dashboard_summary_returns_200(client):
     """Test GET /v1/dashboard/summary returns 200 OK."""
     
-    response = client.get("/v1/dashboard/summary")
+    response = await client.get("/v1/dashboard/summary")
     
     assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
 
 
-def test_dashboard_summary_schema(client):
+async def test_dashboard_summary_schema(client):
     """Test dashboard summary returns valid HomepageSnapshot schema."""
     
-    response = client.get("/v1/dashboard/summary")
+    response = await client.get("/v1/dashboard/summary")
     data = response.json()
     
     # Validate required keys
@@ -65,10 +77,10 @@ def test_dashboard_summary_schema(client):
     assert isinstance(data["analysis"]["paragraphs"], list)
 
 
-def test_timeseries_endpoint_30d(client):
+async def test_timeseries_endpoint_30d(client):
     """Test GET /v1/dashboard/timeseries with 30d window."""
     
-    response = client.get("/v1/dashboard/timeseries?metric=events_per_day&window=30d")
+    response = await client.get("/v1/dashboard/timeseries?metric=events_per_day&window=30d")
     
     assert response.status_code == 200
     data = response.json()
@@ -89,28 +101,28 @@ def test_timeseries_endpoint_30d(client):
         datetime.fromisoformat(point["t"].replace('Z', '+00:00'))
 
 
-def test_timeseries_invalid_metric(client):
+async def test_timeseries_invalid_metric(client):
     """Test timeseries rejects invalid metric."""
     
-    response = client.get("/v1/dashboard/timeseries?metric=invalid_metric&window=30d")
+    response = await client.get("/v1/dashboard/timeseries?metric=invalid_metric&window=30d")
     
     # Should return 422 (validation error)
     assert response.status_code == 422
 
 
-def test_timeseries_invalid_window(client):
+async def test_timeseries_invalid_window(client):
     """Test timeseries rejects invalid window."""
     
-    response = client.get("/v1/dashboard/timeseries?metric=events_per_day&window=invalid")
+    response = await client.get("/v1/dashboard/timeseries?metric=events_per_day&window=invalid")
     
     # Should return 422 (validation error)
     assert response.status_code == 422
 
 
-def test_recent_news_endpoint(client):
+async def test_recent_news_endpoint(client):
     """Test GET /v1/news/recent returns news items."""
     
-    response = client.get("/v1/news/recent?limit=10")
+    response = await client.get("/v1/news/recent?limit=10")
     
     assert response.status_code == 200
     data = response.json()
@@ -129,19 +141,19 @@ def test_recent_news_endpoint(client):
         assert isinstance(item["tags"], list)
 
 
-def test_recent_news_respects_limit(client):
+async def test_recent_news_respects_limit(client):
     """Test news endpoint respects limit parameter."""
     
-    response = client.get("/v1/news/recent?limit=5")
+    response = await client.get("/v1/news/recent?limit=5")
     data = response.json()
     
     assert len(data) <= 5, f"Expected max 5 items, got {len(data)}"
 
 
-def test_recent_news_rejects_high_limit(client):
+async def test_recent_news_rejects_high_limit(client):
     """Test news endpoint rejects limit > 100."""
     
-    response = client.get("/v1/news/recent?limit=1000")
+    response = await client.get("/v1/news/recent?limit=1000")
     
     # Should return 422 (validation error)
     assert response.status_code == 422
@@ -1,27 +1,60 @@
 """Tests for event analysis model and task."""
 import pytest
 from datetime import datetime, timezone
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.database import Base
 from app.models import Event, EventAnalysis, Signpost
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a test database session."""
-    # Use in-memory SQLite for testing
-    engine = create_engine("sqlite:///:memory:")
+@pytest.fixture(scope="session")
+def _engine():
+    """Create the in-memory SQLite schema once per test session."""
+    # StaticPool keeps a single connection so the in-memory database survives
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     Base.metadata.create_all(engine)
     
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    yield engine
+    
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(_engine):
+    """
+    Create a test database session rolled back after each test.
+    
+    Each session.commit() only releases a SAVEPOINT inside the outer
+    transaction, so tests can commit freely without touching the schema.
+    """
+    connection = _engine.connect()
+    transaction = connection.begin()
+    
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     
     yield session
     
     session.close()
-    Base.metadata.drop_all(engine)
+    transaction.rollback()
+    connection.close()
 
 
 def test_event_analysis_model_creation(db_session):
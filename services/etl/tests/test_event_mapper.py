@@ -1,64 +1,41 @@
 """
 Unit tests for event → signpost mapper.
 
-Tests heuristic keyword matching, numeric value extraction,
+Tests alias matching, numeric value extraction,
 confidence calculation, and tier policy enforcement.
 """
 import pytest
-from datetime import datetime, timezone
 
-from app.mapping.event_mapper import (
+from app.utils.event_mapper import (
     extract_numeric_values,
-    match_keywords_to_signposts,
+    map_event_to_signposts,
     calculate_final_confidence,
-    refine_with_numeric_context
 )
 
 
-def test_extract_percentage():
-    """Test percentage extraction from text."""
-    text = "Model achieves 85.5% on SWE-bench Verified"
+@pytest.mark.parametrize("text,key,val", [
+    ("Model achieves 85.5% on SWE-bench Verified", "percentage", 85.5),
+    ("Training run used 10^27 FLOPs", "flops_exponent", 27),
+    ("Compute budget of 1e26 floating point operations", "flops_exponent", 26),
+    ("New datacenter requires 5.2 GW of power", "power_gw", 5.2),
+    ("Random news about weather and sports", "percentage", None),
+    ("Random news about weather and sports", "flops_exponent", None),
+    ("Random news about weather and sports", "power_gw", None),
+])
+def test_extract_numeric_values(text, key, val):
+    """Test percentage, FLOP exponent and GW extraction (None when absent)."""
     values = extract_numeric_values(text)
-    assert values["percentage"] == 85.5
+    assert values[key] == val
 
 
-def test_extract_flop_exponent():
-    """Test FLOP exponent extraction."""
-    text1 = "Training run used 10^27 FLOPs"
-    values1 = extract_numeric_values(text1)
-    assert values1["flops_exponent"] == 27
-    
-    text2 = "Compute budget of 1e26 floating point operations"
-    values2 = extract_numeric_values(text2)
-    assert values2["flops_exponent"] == 26
-
-
-def test_extract_power():
-    """Test power extraction in GW."""
-    text = "New datacenter requires 5.2 GW of power"
-    values = extract_numeric_values(text)
-    assert values["power_gw"] == 5.2
-
-
-def test_keyword_matching_swebench(db_session):
-    """Test SWE-bench keyword matching."""
-    from app.models import Signpost
-    
-    # Seed a signpost
-    sp = Signpost(
-        code="swe_bench_85",
-        category="capabilities",
-        metric_name="SWE-bench Verified %",
-        direction=">=",
-        target_value=85,
-        baseline=20,
-        first_class=True
-    )
-    db_session.add(sp)
-    db_session.commit()
-    
-    text = "New model achieves 85% on SWE-bench Verified benchmark"
-    matches = match_keywords_to_signposts(text, db_session)
+def test_alias_matching_swebench():
+    """Test SWE-bench text maps to the SWE-bench signposts via the alias registry."""
+    event = {
+        "title": "New model achieves 85% on SWE-bench Verified benchmark",
+        "summary": "",
+        "evidence_tier": "B",
+    }
+    matches = map_event_to_signposts(event)
     
     assert len(matches) > 0
     codes = [m[0] for m in matches]
@@ -101,14 +78,3 @@ def test_tier_policy_never_moves_gauges_cd():
     # B tier should get small boost
     conf_b = calculate_final_confidence(0.5, False, False, "B")
     assert conf_b == 0.55  # +0.05 tier boost
-
-
-def test_no_matches_returns_empty():
-    """Test that unrelated text returns no matches."""
-    text = "Random news about weather and sports"
-    values = extract_numeric_values(text)
-    
-    assert values["percentage"] is None
-    assert values["flops_exponent"] is None
-    assert values["power_gw"] is None
-
@@ -5,11 +5,20 @@ Tests:
 - Alias pattern matching (SWE-bench, OSWorld, WebArena, GPQA, Inputs, Security)
 - Tier propagation (A/B/C/D)
 - Confidence thresholds
-- Cap to 2 signposts per event
+- Cap to 5 signposts per event
 - De-dup logic
 """
 import pytest
-from services.etl.app.utils.event_mapper import map_event_to_signposts, needs_review
+from app.utils import event_mapper
+from app.utils.event_mapper import (
+    compile_alias_prefilter,
+    compile_aliases,
+    default_alias_rules,
+    load_aliases,
+    map_event_to_signposts,
+    match_aliases,
+    needs_review,
+)
 
 
 def test_swebench_alias_match():
@@ -22,7 +31,7 @@ def test_swebench_alias_match():
     results = map_event_to_signposts(event)
     codes = [r[0] for r in results]
     assert "swe_bench_85" in codes or "swe_bench_90" in codes
-    assert len(results) <= 2  # Cap enforced
+    assert len(results) <= 5  # Cap enforced
 
 
 def test_compute_flop_alias_match():
@@ -77,29 +86,30 @@ def test_tier_cd_no_boost():
         assert conf_c <= 0.95
 
 
-def test_needs_review_cd_always():
-    """Test C/D tier always needs review (policy)."""
-    assert needs_review(0.9, "C") is True
-    assert needs_review(0.9, "D") is True
+@pytest.mark.parametrize("conf,tier,expected", [
+    (0.9, "C", True),   # C/D always need review (policy)
+    (0.9, "D", True),
+    (0.5, "A", True),   # A/B need review if confidence < 0.6
+    (0.7, "A", False),
+    (0.9, "A", False),
+    (0.5, "B", True),
+    (0.6, "B", False),
+    (0.7, "B", False),
+])
+def test_needs_review(conf, tier, expected):
+    """Test the tier × confidence review policy."""
+    assert needs_review(conf, tier) is expected
 
 
-def test_needs_review_ab_threshold():
-    """Test A/B tier needs review if confidence < 0.6."""
-    assert needs_review(0.5, "A") is True
-    assert needs_review(0.7, "A") is False
-    assert needs_review(0.5, "B") is True
-    assert needs_review(0.6, "B") is False
-
-
-def test_cap_two_signposts():
-    """Test mapper caps to 2 signposts per event."""
+def test_cap_five_signposts():
+    """Test mapper caps to 5 signposts per event (match_aliases default)."""
     event = {
         "title": "Multi-benchmark progress: SWE-bench 85%, OSWorld 60%, WebArena 70%",
         "summary": "Broad improvements across benchmarks.",
         "evidence_tier": "A"
     }
     results = map_event_to_signposts(event)
-    assert len(results) <= 2, f"Expected max 2 signposts, got {len(results)}"
+    assert len(results) <= 5, f"Expected max 5 signposts, got {len(results)}"
 
 
 def test_no_match_returns_empty():
@@ -111,3 +121,32 @@ def test_no_match_returns_empty():
     }
     results = map_event_to_signposts(event)
     assert len(results) == 0
+
+
+def test_prefilter_does_not_change_results():
+    """Test the fused prefilter path matches mapping against the raw rules."""
+    for title in ("GPT-5 hits 80% on SWE-bench Verified", "Local bakery wins bread contest"):
+        event = {"title": title, "summary": "", "evidence_tier": "B"}
+        assert map_event_to_signposts(event) == map_event_to_signposts(event, default_alias_rules())
+
+
+@pytest.fixture(params=["re", "re2"])
+def alias_engine(request, monkeypatch):
+    """Alias rules and fused prefilter compiled with stdlib re, then with RE2 (if installed)."""
+    if request.param == "re2":
+        monkeypatch.setattr(event_mapper, "re2", pytest.importorskip("re2"))
+    else:
+        monkeypatch.setattr(event_mapper, "re2", None)
+    rules = compile_aliases(load_aliases())
+    return rules, compile_alias_prefilter(rules)
+
+
+def test_prefilter_has_no_false_negatives(alias_engine, news_goldset):
+    """Test the prefilter never rejects text some rule matches, under either engine."""
+    rules, prefilter = alias_engine
+    assert prefilter is not None
+    
+    texts = [f"{ex['title']} {ex.get('summary', '')}" for ex in news_goldset]
+    texts += ["GPT-5 hits 80% on SWE-bench Verified", "Local bakery wins bread contest"]
+    for text in texts:
+        assert match_aliases(text, rules, prefilter=prefilter) == match_aliases(text, rules), text
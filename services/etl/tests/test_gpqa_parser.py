@@ -1,15 +1,30 @@
 """Unit tests for GPQA-Diamond parser."""
-import json
+import orjson
 import pytest
 from pathlib import Path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gpqa_sample():
-    """Load GPQA sample fixture."""
+    """Load GPQA sample fixture once per session (read-only)."""
     fixture_path = Path(__file__).parent / "fixtures" / "gpqa_sample.json"
-    with open(fixture_path) as f:
-        return json.load(f)
+    return orjson.loads(fixture_path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def gpqa_schema_errors(gpqa_sample):
+    """Validate every leaderboard entry once; returns a list of problems."""
+    errors = []
+    for i, entry in enumerate(gpqa_sample["leaderboard_data"]):
+        if "accuracy" not in entry:
+            errors.append(f"entry {i}: missing accuracy")
+            continue
+        accuracy = entry["accuracy"]
+        if not isinstance(accuracy, (int, float)):
+            errors.append(f"entry {i}: accuracy {accuracy!r} is not numeric")
+        elif not 0 <= accuracy <= 1.0:  # Decimal accuracy
+            errors.append(f"entry {i}: accuracy {accuracy} outside [0, 1]")
+    return errors
 
 
 def test_gpqa_parse_structure(gpqa_sample):
@@ -19,13 +34,9 @@ def test_gpqa_parse_structure(gpqa_sample):
     assert "leaderboard_data" in gpqa_sample
 
 
-def test_gpqa_parse_values(gpqa_sample):
+def test_gpqa_parse_values(gpqa_schema_errors):
     """Test that GPQA entries have valid numeric values."""
-    for entry in gpqa_sample["leaderboard_data"]:
-        assert "accuracy" in entry
-        accuracy = entry["accuracy"]
-        assert isinstance(accuracy, (int, float))
-        assert 0 <= accuracy <= 1.0  # Decimal accuracy
+    assert not gpqa_schema_errors, gpqa_schema_errors
 
 
 def test_gpqa_signpost_mapping(gpqa_sample):
@@ -10,24 +10,44 @@ Verifies:
 - Stats endpoint aggregation
 """
 
+import csv
+import io
+
 import pytest
 from datetime import date, timedelta
-from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.main import app
 from app.models import Incident
 from app.database import get_db
+from app.services.incidents import compute_incident_stats, query_incidents
+
+@pytest.fixture(scope="module")
+def db(module_db_session):
+    """Module-wide session; seeded rows are rolled back after the last test."""
+    return module_db_session
 
-client = TestClient(app)
+
+@pytest.fixture(scope="module")
+def client(db, _test_client):
+    """Session-wide TestClient bound to the module-wide session."""
+    def override_get_db():
+        yield db
+    
+    app.dependency_overrides[get_db] = override_get_db
+    
+    yield _test_client
+    
+    app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def seed_incidents(db: Session):
-    """Seed test incidents with various severities and vectors."""
+    """Seed test incidents with various severities and vectors (once per module)."""
     
     incidents = [
-        Incident(
+        dict(
             occurred_at=date.today() - timedelta(days=10),
             title="ChatGPT Jailbreak via DAN Prompt",
             description="Users bypass safety guidelines using 'Do Anything Now' prompt",
@@ -37,7 +57,7 @@ def seed_incidents(db: Session):
             external_url="https://example.com/incident1",
             source="Reddit"
         ),
-        Incident(
+        dict(
             occurred_at=date.today() - timedelta(days=30),
             title="GPT-4 Generates Malware Code",
             description="Model outputs functional exploit code despite filters",
@@ -47,7 +67,7 @@ def seed_incidents(db: Session):
             external_url="https://example.com/incident2",
             source="ArXiv"
         ),
-        Incident(
+        dict(
             occurred_at=date.today() - timedelta(days=60),
             title="Training Data Privacy Leak",
             description="Model reproduces verbatim training data including PII",
@@ -56,7 +76,7 @@ def seed_incidents(db: Session):
             external_url="https://example.com/incident3",
             source="Nature"
         ),
-        Incident(
+        dict(
             occurred_at=date.today() - timedelta(days=5),
             title="Minor Alignment Drift Detected",
             description="Small degradation in RLHF effectiveness",
@@ -65,101 +85,75 @@ def seed_incidents(db: Session):
         ),
     ]
     
-    for i in incidents:
-        db.add(i)
+    # One executemany round-trip instead of per-object unit-of-work inserts
+    db.execute(insert(Incident), incidents)
     db.commit()
     
     yield
     
-    # Cleanup
-    db.query(Incident).delete()
-    db.commit()
+    # Cleanup happens in module_db_session teardown (transaction rollback)
 
 
-def test_get_incidents_all(seed_incidents):
-    """Test GET /v1/incidents without filters."""
-    response = client.get("/v1/incidents")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert isinstance(data, list)
+def test_get_incidents_all(db, seed_incidents):
+    """Test incident listing without filters."""
+    data = query_incidents(db)
     assert len(data) >= 4  # At least our 4 test incidents
     
     # Check structure
-    if data:
-        first = data[0]
-        assert "id" in first
-        assert "occurred_at" in first
-        assert "title" in first
-        assert "severity" in first
+    first = data[0]
+    assert first.id is not None
+    assert first.occurred_at is not None
+    assert first.title
+    assert first.severity is not None
 
 
-def test_get_incidents_severity_filter(seed_incidents):
-    """Test filtering by severity."""
-    response = client.get("/v1/incidents?severity=5")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert isinstance(data, list)
+def _check_severity(data):
     assert len(data) == 1  # Only 1 critical incident
-    
-    incident = data[0]
-    assert incident["severity"] == 5
-    assert "Privacy Leak" in incident["title"]
+    assert data[0].severity == 5
+    assert "Privacy Leak" in data[0].title
 
 
-def test_get_incidents_vector_filter(seed_incidents):
-    """Test filtering by vector."""
-    response = client.get("/v1/incidents?vector=jailbreak")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert isinstance(data, list)
+def _check_vector(data):
     assert len(data) >= 1
-    
     # All should have jailbreak vector
     for incident in data:
-        assert incident["vectors"] is not None
-        assert "jailbreak" in incident["vectors"]
+        assert incident.vectors is not None
+        assert "jailbreak" in incident.vectors
 
 
-def test_get_incidents_date_filter(seed_incidents):
-    """Test filtering by date range."""
-    since_date = (date.today() - timedelta(days=20)).isoformat()
-    response = client.get(f"/v1/incidents?since={since_date}")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert isinstance(data, list)
+def _check_since(data):
     # Should get incidents from last 20 days (2 of them)
     assert len(data) >= 2
 
 
-def test_get_incidents_signpost_filter(seed_incidents):
-    """Test filtering by signpost code."""
-    response = client.get("/v1/incidents?signpost=safety_alignment")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert isinstance(data, list)
+def _check_signpost(data):
     assert len(data) >= 1
-    
     # All should reference the signpost
     for incident in data:
-        assert incident["signpost_codes"] is not None
-        assert "safety_alignment" in incident["signpost_codes"]
+        assert incident.signpost_codes is not None
+        assert "safety_alignment" in incident.signpost_codes
 
 
-def test_get_incidents_limit(seed_incidents):
-    """Test limit parameter."""
-    response = client.get("/v1/incidents?limit=2")
-    assert response.status_code == 200
-    
-    data = response.json()
+def _check_limit(data):
     assert len(data) <= 2
 
 
-def test_get_incidents_csv_export(seed_incidents):
+FILTER_CASES = [
+    ({"severity": 5}, _check_severity),
+    ({"vector": "jailbreak"}, _check_vector),
+    ({"since": date.today() - timedelta(days=20)}, _check_since),
+    ({"signpost": "safety_alignment"}, _check_signpost),
+    ({"limit": 2}, _check_limit),
+]
+
+
+@pytest.mark.parametrize("filters,check", FILTER_CASES, ids=[next(iter(f)) for f, _ in FILTER_CASES])
+def test_get_incidents_filters(db, seed_incidents, filters, check):
+    """Test severity, vector, date, signpost and limit filters."""
+    check(query_incidents(db, **filters))
+
+
+def test_get_incidents_csv_export(client, seed_incidents):
     """Test CSV export format."""
     response = client.get("/v1/incidents?format=csv")
     assert response.status_code == 200
@@ -170,11 +164,12 @@ def test_get_incidents_csv_export(seed_incidents):
     
     # Check content
     content = response.text
-    assert "ID,Date,Title,Severity" in content  # CSV header
-    assert len(content.split('\n')) >= 5  # Header + 4 incidents
+    header = next(csv.reader(io.StringIO(content)))
+    assert header[:4] == ["ID", "Date", "Title", "Severity"]
+    assert content.count("\n") >= 4  # Header + 4 incidents
 
 
-def test_get_incidents_cache_headers(seed_incidents):
+def test_get_incidents_cache_headers(client, seed_incidents):
     """Test cache headers."""
     response = client.get("/v1/incidents")
     assert response.status_code == 200
@@ -183,12 +178,9 @@ def test_get_incidents_cache_headers(seed_incidents):
     assert "cache-control" in response.headers or "Cache-Control" in response.headers
 
 
-def test_get_incident_stats(seed_incidents):
-    """Test GET /v1/incidents/stats endpoint."""
-    response = client.get("/v1/incidents/stats?days=90")
-    assert response.status_code == 200
-    
-    data = response.json()
+def test_get_incident_stats(db, seed_incidents):
+    """Test incident stats aggregation."""
+    data = compute_incident_stats(db, days=90)
     assert "total" in data
     assert "by_severity" in data
     assert "by_vector" in data
@@ -203,7 +195,7 @@ def test_get_incident_stats(seed_incidents):
     assert "jailbreak" in data["by_vector"]
 
 
-def test_get_incident_stats_cache(seed_incidents):
+def test_get_incident_stats_cache(client, seed_incidents):
     """Test stats endpoint caching."""
     response = client.get("/v1/incidents/stats")
     assert response.status_code == 200
@@ -1,122 +1,84 @@
 """Tests for LLM budget tracking utilities."""
+import fakeredis
 import pytest
-from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone
 
 from app.utils.llm_budget import check_budget, record_spend, get_budget_status
 
 
-@pytest.fixture
-def mock_redis():
-    """Mock Redis client for testing."""
-    redis_mock = MagicMock()
-    redis_mock.get.return_value = None
-    redis_mock.incrbyfloat.return_value = 0.0
-    return redis_mock
+@pytest.fixture(scope="session")
+def _fake_redis_server():
+    """One in-process fake Redis for the whole session."""
+    return fakeredis.FakeStrictRedis(decode_responses=True)
 
 
-def test_check_budget_no_spend(mock_redis):
-    """Test budget check with no spend."""
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        budget = check_budget()
-        
-        assert budget['current_spend_usd'] == 0.0
-        assert budget['warning'] is False
-        assert budget['blocked'] is False
-        assert budget['remaining_usd'] == 50.0
+@pytest.fixture(autouse=True)
+def fake_redis(_fake_redis_server, monkeypatch):
+    """Route budget tracking to the fake Redis, emptied before each test."""
+    _fake_redis_server.flushall()
+    monkeypatch.setattr("app.utils.llm_budget.get_redis_client", lambda: _fake_redis_server)
+    return _fake_redis_server
 
 
-def test_check_budget_warning_threshold(mock_redis):
-    """Test budget check at warning threshold."""
-    mock_redis.get.return_value = '20.0'
-    
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        budget = check_budget()
-        
-        assert budget['current_spend_usd'] == 20.0
-        assert budget['warning'] is True
-        assert budget['blocked'] is False
+def _budget_key():
+    """Today's budget key, as used by llm_budget."""
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return f"llm_budget:daily:{today}"
 
 
-def test_check_budget_hard_limit(mock_redis):
-    """Test budget check at hard limit."""
-    mock_redis.get.return_value = '50.0'
+@pytest.mark.parametrize("spend,warning,blocked,remaining", [
+    (None, False, False, 50.0),   # No spend recorded yet
+    (20.0, True, False, 30.0),    # Warning threshold
+    (50.0, True, True, 0.0),      # Hard limit
+    (75.0, True, True, 0.0),      # Over hard limit
+])
+def test_check_budget(fake_redis, spend, warning, blocked, remaining):
+    """Test budget check across the warning/hard-limit thresholds."""
+    if spend is not None:
+        fake_redis.set(_budget_key(), str(spend))
     
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        budget = check_budget()
-        
-        assert budget['current_spend_usd'] == 50.0
-        assert budget['warning'] is True
-        assert budget['blocked'] is True
-        assert budget['remaining_usd'] == 0.0
-
-
-def test_check_budget_over_limit(mock_redis):
-    """Test budget check over hard limit."""
-    mock_redis.get.return_value = '75.0'
+    budget = check_budget()
     
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        budget = check_budget()
-        
-        assert budget['current_spend_usd'] == 75.0
-        assert budget['blocked'] is True
+    assert budget['current_spend_usd'] == (spend or 0.0)
+    assert budget['warning'] is warning
+    assert budget['blocked'] is blocked
+    assert budget['remaining_usd'] == remaining
 
 
-def test_record_spend(mock_redis):
+def test_record_spend(fake_redis):
     """Test recording spend."""
-    mock_redis.incrbyfloat.return_value = 5.5
-    
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        record_spend(5.5, model='gpt-4o-mini')
-        
-        # Verify Redis calls
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        key = f"llm_budget:daily:{today}"
-        
-        mock_redis.incrbyfloat.assert_called_once_with(key, 5.5)
-        mock_redis.expire.assert_called_once()
-
-
-def test_get_budget_status_ok(mock_redis):
-    """Test budget status when OK."""
-    mock_redis.get.return_value = '10.0'
+    record_spend(5.5, model='gpt-4o-mini')
+    record_spend(1.25, model='gpt-4o-mini')
     
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        status = get_budget_status()
-        
-        assert status['status'] == 'OK'
-        assert status['current_spend_usd'] == 10.0
-        assert 'Budget OK' in status['message']
-
-
-def test_get_budget_status_warning(mock_redis):
-    """Test budget status at warning threshold."""
-    mock_redis.get.return_value = '25.0'
+    # Spend accumulates under today's key, which gets a TTL
+    key = _budget_key()
+    assert float(fake_redis.get(key)) == 6.75
+    assert fake_redis.ttl(key) > 0
+
+
+@pytest.mark.parametrize("spend,status_name,message", [
+    (10.0, 'OK', 'Budget OK'),
+    (25.0, 'WARNING', 'Approaching'),
+    (60.0, 'BLOCKED', 'exceeded'),
+])
+def test_get_budget_status(fake_redis, spend, status_name, message):
+    """Test budget status and message at each threshold band."""
+    fake_redis.set(_budget_key(), str(spend))
     
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        status = get_budget_status()
-        
-        assert status['status'] == 'WARNING'
-        assert 'Approaching' in status['message']
-
-
-def test_get_budget_status_blocked(mock_redis):
-    """Test budget status when blocked."""
-    mock_redis.get.return_value = '60.0'
+    status = get_budget_status()
     
-    with patch('app.utils.llm_budget.get_redis_client', return_value=mock_redis):
-        status = get_budget_status()
-        
-        assert status['status'] == 'BLOCKED'
-        assert 'exceeded' in status['message']
+    assert status['status'] == status_name
+    assert status['current_spend_usd'] == spend
+    assert message in status['message']
 
 
-def test_check_budget_redis_unavailable():
+def test_check_budget_redis_unavailable(monkeypatch):
     """Test budget check when Redis is unavailable."""
-    with patch('app.utils.llm_budget.get_redis_client', return_value=None):
-        budget = check_budget()
-        
-        # Should return safe defaults (not blocked)
-        assert budget['blocked'] is False
-        assert 'redis_unavailable' in budget
-        assert budget['redis_unavailable'] is True
+    monkeypatch.setattr("app.utils.llm_budget.get_redis_client", lambda: None)
+    
+    budget = check_budget()
+    
+    # Should return safe defaults (not blocked)
+    assert budget['blocked'] is False
+    assert 'redis_unavailable' in budget
+    assert budget['redis_unavailable'] is True
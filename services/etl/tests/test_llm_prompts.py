@@ -1,11 +1,20 @@
 """Unit tests for LLM prompt tracking."""
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+from openai.types.chat import ChatCompletion
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 
 from app.models import LLMPrompt, LLMPromptRun
 from app.utils.llm_instrumentation import calculate_cost, hash_string, track_llm_call
 
+# Known SHA-256 digests (hex) for the fixed strings used below
+TEST_INPUT_HASH = "9dfe6f15d1ab73af898739394fd22fd72a03db01834582f24bb2e1c66c7aaeae"
+TEST_OUTPUT_HASH = "0883407507398f58e21ab97dfc45a7795e51dfe427fdd605fbce08db750727f9"
+INPUT_1_HASH = "99d3a91e7e87eb4997107275226155498555e34322ffebe829e79cb7daeca5b9"
+
 
 class TestLLMPromptPersistence:
     """Test LLM prompt template storage and retrieval."""
@@ -68,10 +77,11 @@ class TestLLMPromptPersistence:
             prompt_template="Different text",
             model="gpt-4o"
         )
-        db_session.add(prompt2)
-        
-        with pytest.raises(Exception):  # IntegrityError
-            db_session.commit()
+        # Only the SAVEPOINT aborts; the session stays usable afterwards
+        with pytest.raises(IntegrityError):
+            with db_session.begin_nested():
+                db_session.add(prompt2)
+                db_session.flush()
 
 
 class TestLLMPromptRuns:
@@ -83,8 +93,8 @@ class TestLLMPromptRuns:
             prompt_id=sample_prompt.id,
             task_name="event_analysis",
             event_id=123,
-            input_hash=hash_string("test input"),
-            output_hash=hash_string("test output"),
+            input_hash=TEST_INPUT_HASH,
+            output_hash=TEST_OUTPUT_HASH,
             prompt_tokens=100,
             completion_tokens=200,
             total_tokens=300,
@@ -118,54 +128,56 @@ class TestLLMPromptRuns:
         assert cost_4o > cost_mini  # gpt-4o is more expensive
     
     def test_hash_string_consistency(self):
-        """Hash function should be deterministic."""
-        text = "test input"
-        hash1 = hash_string(text)
-        hash2 = hash_string(text)
-        
-        assert hash1 == hash2
-        assert len(hash1) == 64  # SHA-256 hex length
+        """Hash function should be deterministic (matches a known SHA-256 digest)."""
+        assert hash_string("test input") == TEST_INPUT_HASH
+        assert len(TEST_INPUT_HASH) == 64  # SHA-256 hex length
     
     def test_hash_string_uniqueness(self):
         """Different inputs should produce different hashes."""
-        hash1 = hash_string("input 1")
-        hash2 = hash_string("input 2")
-        
-        assert hash1 != hash2
+        assert hash_string("input 1") == INPUT_1_HASH
+        assert hash_string("input 2") != INPUT_1_HASH
 
 
 class TestLLMInstrumentation:
     """Test LLM call decorator."""
     
-    @patch("app.utils.llm_instrumentation.SessionLocal")
-    def test_track_llm_call_decorator(self, mock_session_factory):
+    def test_track_llm_call_decorator(self, db_session, monkeypatch):
         """Test that decorator records LLM calls."""
-        mock_db = MagicMock()
-        mock_session_factory.return_value = mock_db
-        
-        # Mock LLM response
-        mock_response = MagicMock()
-        mock_response.usage.prompt_tokens = 100
-        mock_response.usage.completion_tokens = 200
-        mock_response.usage.total_tokens = 300
-        mock_response.model = "gpt-4o-mini"
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "test output"
+        monkeypatch.setattr("app.utils.llm_instrumentation.SessionLocal", lambda: db_session)
+        
+        # Real (offline) LLM response so the decorator extracts usage
+        response = ChatCompletion.model_validate({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "test output"},
+            }],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 200, "total_tokens": 300},
+        })
         
         # Define test function
-        @track_llm_call(task_name="test_task", event_id=123)
-        def mock_llm_call(text: str):
-            return mock_response
+        @track_llm_call(task_name="test_task")
+        def llm_call(text: str):
+            return response
         
         # Call it
-        result = mock_llm_call("test input")
+        result = llm_call("test input")
         
         # Verify response returned
-        assert result == mock_response
-        
-        # Verify database write attempted
-        mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
+        assert result is response
+        
+        # Verify the run was persisted
+        assert db_session.query(LLMPromptRun).count() == 1
+        run = db_session.query(LLMPromptRun).one()
+        assert run.task_name == "test_task"
+        assert run.model == "gpt-4o-mini"
+        assert run.total_tokens == 300
+        assert run.output_hash == TEST_OUTPUT_HASH
+        assert run.success is True
     
     def test_track_llm_call_error_handling(self):
         """Decorator should handle LLM errors gracefully."""
@@ -183,7 +195,8 @@ class TestLLMInstrumentation:
 class TestLLMBudgetTracking:
     """Test daily budget tracking."""
     
-    def test_daily_spend_calculation(self, db_session, sample_prompt):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_daily_spend_calculation(self, db_session, sample_prompt):
         """Test calculating total spend for a day."""
         from app.utils.llm_instrumentation import get_daily_llm_spend
         from datetime import date
@@ -192,7 +205,7 @@ class TestLLMBudgetTracking:
         
         # Add some runs
         runs = [
-            LLMPromptRun(
+            dict(
                 prompt_id=sample_prompt.id,
                 task_name="task1",
                 input_hash="hash1",
@@ -203,7 +216,7 @@ class TestLLMBudgetTracking:
                 model="gpt-4o-mini",
                 success=True
             ),
-            LLMPromptRun(
+            dict(
                 prompt_id=sample_prompt.id,
                 task_name="task2",
                 input_hash="hash2",
@@ -216,12 +229,12 @@ class TestLLMBudgetTracking:
             )
         ]
         
-        for run in runs:
-            db_session.add(run)
+        db_session.execute(insert(LLMPromptRun), runs)
         db_session.commit()
         
-        # Calculate spend
-        result = await get_daily_llm_spend(datetime.now(timezone.utc))
+        # Calculate spend (against the test session, not the app database)
+        with patch("app.utils.llm_instrumentation.SessionLocal", return_value=db_session):
+            result = await get_daily_llm_spend(datetime.now(timezone.utc))
         
         assert result["total_cost_usd"] == 0.0023  # 0.0015 + 0.0008
         assert result["total_tokens"] == 4500  # 3000 + 1500
@@ -3,17 +3,51 @@
 Tests claim-to-signpost mapping accuracy using labeled golden examples.
 Asserts F1 score >= 0.75 for rule-based mapping.
 """
-import json
+import re
+
+import numpy as np
+import orjson
 import pytest
-from pathlib import Path
-from typing import List, Set, Tuple
+from typing import List, Tuple
+
+from tests.conftest import SEEDS_DIR
+
+
+@pytest.fixture(scope="session")
+def goldset():
+    """Golden test set, parsed once per session (read-only)."""
+    return orjson.loads((SEEDS_DIR / "goldset.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def goldset_expected(goldset):
+    """Expected signpost codes per example, precomputed as frozensets."""
+    return tuple(frozenset(example["expected_signposts"]) for example in goldset["examples"])
 
 
-def load_golden_set():
-    """Load golden test set from JSON."""
-    goldset_path = Path(__file__).parent.parent.parent.parent / "infra" / "seeds" / "goldset.json"
-    with open(goldset_path) as f:
-        return json.load(f)
+# One alternation for every rule keyword; group order is rule priority
+_METRIC_RE = re.compile(
+    r"(?P<swe>swe[-_]bench)"
+    r"|(?P<osworld>osworld)"
+    r"|(?P<webarena>webarena)"  # also matches visualwebarena
+    r"|(?P<gpqa>gpqa)"
+    r"|(?P<flop>flop)"
+    r"|(?P<dc>dc|datacenter|power)"
+    r"|(?P<algo>algorithmic|efficiency)"
+    r"|(?P<sec>security|maturity)"
+    r"|(?P<evals>eval|mandate)",
+    re.IGNORECASE,
+)
+_RULE_PRIORITY = _METRIC_RE.groupindex
+
+# Rules that map regardless of metric value
+_FIXED_SIGNPOSTS = {
+    "swe": ("swe_bench_85", "swe_bench_90"),
+    "osworld": ("osworld_65", "osworld_85"),
+    "webarena": ("webarena_70", "webarena_85"),
+    "gpqa": ("gpqa_sota", "gpqa_phd_parity"),
+    "sec": ("sec_maturity",),
+}
 
 
 def map_claim_to_signposts(claim: dict) -> List[str]:
@@ -22,129 +56,105 @@ def map_claim_to_signposts(claim: dict) -> List[str]:
     
     This simulates the mapping logic from the connectors.
     In production, this would use the actual mapping functions.
+    
+    When a metric name hits several rules, the highest-priority rule wins.
     """
-    signposts = []
-    metric_name = claim.get("metric_name", "").lower()
+    metric_name = claim.get("metric_name", "")
     metric_value = claim.get("metric_value", 0)
     
-    # SWE-bench mapping (any value maps to potential signposts)
-    if "swe-bench" in metric_name or "swe_bench" in metric_name:
-        signposts.extend(["swe_bench_85", "swe_bench_90"])
-    
-    # OSWorld mapping (any value maps to potential signposts)
-    elif "osworld" in metric_name:
-        signposts.extend(["osworld_65", "osworld_85"])
+    rule = min(
+        (match.lastgroup for match in _METRIC_RE.finditer(metric_name)),
+        key=_RULE_PRIORITY.__getitem__,
+        default=None,
+    )
     
-    # WebArena mapping (any value maps to potential signposts)
-    elif "webarena" in metric_name or "visualwebarena" in metric_name:
-        signposts.extend(["webarena_70", "webarena_85"])
-    
-    # GPQA mapping (any value maps to potential signposts)
-    elif "gpqa" in metric_name:
-        signposts.extend(["gpqa_sota", "gpqa_phd_parity"])
+    if rule in _FIXED_SIGNPOSTS:
+        return list(_FIXED_SIGNPOSTS[rule])
     
     # Training FLOPs mapping
-    elif "flop" in metric_name.lower():
+    if rule == "flop":
         if metric_value >= 1e27 or metric_value >= 27:
-            signposts.append("inputs_flops_27")
-        elif metric_value >= 1e26 or metric_value >= 26:
-            signposts.append("inputs_flops_26")
-        elif metric_value >= 1e25 or metric_value >= 25:
-            signposts.append("inputs_flops_25")
+            return ["inputs_flops_27"]
+        if metric_value >= 1e26 or metric_value >= 26:
+            return ["inputs_flops_26"]
+        if metric_value >= 1e25 or metric_value >= 25:
+            return ["inputs_flops_25"]
     
     # DC Power mapping
-    elif "dc" in metric_name.lower() or "datacenter" in metric_name.lower() or "power" in metric_name.lower():
+    elif rule == "dc":
         if metric_value >= 10:
-            signposts.append("inputs_dc_10gw")
-        elif metric_value >= 1:
-            signposts.append("inputs_dc_1gw")
+            return ["inputs_dc_10gw"]
+        if metric_value >= 1:
+            return ["inputs_dc_1gw"]
     
     # Algorithmic Efficiency mapping
-    elif "algorithmic" in metric_name.lower() or "efficiency" in metric_name.lower():
+    elif rule == "algo":
         if metric_value >= 100:
-            signposts.append("inputs_algo_oom")
-    
-    # Security mapping
-    elif "security" in metric_name.lower() or "maturity" in metric_name.lower():
-        signposts.append("sec_maturity")
+            return ["inputs_algo_oom"]
     
     # Mandatory evals mapping
-    elif "eval" in metric_name.lower() or "mandate" in metric_name.lower():
+    elif rule == "evals":
         if metric_value >= 1:
-            signposts.append("mandatory_evals")
+            return ["mandatory_evals"]
     
-    return signposts
+    return []
 
 
-def compute_f1(predicted: Set[str], expected: Set[str]) -> Tuple[float, float, float]:
+def compute_f1(tp: np.ndarray, fp: np.ndarray, fn: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Compute precision, recall, and F1 score.
+    Compute per-example precision, recall, and F1 score from count arrays.
+    
+    An example with nothing predicted and nothing expected scores 1.0.
     
     Args:
-        predicted: Set of predicted signpost codes
-        expected: Set of expected signpost codes
+        tp: True positives per example
+        fp: False positives per example
+        fn: False negatives per example
     
     Returns:
-        Tuple of (precision, recall, f1)
+        Tuple of (precision, recall, f1) arrays
     """
-    if not predicted and not expected:
-        return 1.0, 1.0, 1.0
-    
-    if not predicted or not expected:
-        return 0.0, 0.0, 0.0
-    
-    true_positives = len(predicted & expected)
-    false_positives = len(predicted - expected)
-    false_negatives = len(expected - predicted)
-    
-    precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
-    recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
-    
-    if precision + recall == 0:
-        f1 = 0.0
-    else:
-        f1 = 2 * (precision * recall) / (precision + recall)
+    empty = (tp + fp + fn) == 0
+    precision = np.where(empty, 1.0, tp / np.maximum(tp + fp, 1))
+    recall = np.where(empty, 1.0, tp / np.maximum(tp + fn, 1))
+    denom = precision + recall
+    f1 = np.where(denom > 0, 2 * precision * recall / np.where(denom > 0, denom, 1), 0.0)
     
     return precision, recall, f1
 
 
-def test_golden_set_f1():
+def test_golden_set_f1(goldset, goldset_expected):
     """Test that golden set mapping achieves F1 >= 0.75."""
-    goldset = load_golden_set()
     examples = goldset["examples"]
-    
-    total_precision = 0.0
-    total_recall = 0.0
-    total_f1 = 0.0
-    
-    for example in examples:
-        # Get expected signposts
-        expected_signposts = set(example["expected_signposts"])
-        
-        # Map claims to signposts
-        predicted_signposts = set()
-        for claim in example["expected_claims"]:
-            predicted = map_claim_to_signposts(claim)
-            predicted_signposts.update(predicted)
-        
-        # Compute metrics
-        precision, recall, f1 = compute_f1(predicted_signposts, expected_signposts)
-        
-        total_precision += precision
-        total_recall += recall
-        total_f1 += f1
-    
-    # Compute average metrics
     num_examples = len(examples)
-    avg_precision = total_precision / num_examples
-    avg_recall = total_recall / num_examples
-    avg_f1 = total_f1 / num_examples
+    
+    # Map claims to signposts
+    predicted = [
+        {code for claim in example["expected_claims"] for code in map_claim_to_signposts(claim)}
+        for example in examples
+    ]
+    pairs = list(zip(predicted, goldset_expected))
+    
+    tp = np.fromiter((len(p & e) for p, e in pairs), dtype=np.int32, count=num_examples)
+    fp = np.fromiter((len(p - e) for p, e in pairs), dtype=np.int32, count=num_examples)
+    fn = np.fromiter((len(e - p) for p, e in pairs), dtype=np.int32, count=num_examples)
+    
+    precision, recall, f1 = compute_f1(tp, fp, fn)
+    
+    # Macro averages (asserted) and micro averages (reported)
+    avg_precision = precision.mean()
+    avg_recall = recall.mean()
+    avg_f1 = f1.mean()
+    micro_precision, micro_recall, micro_f1 = (
+        m.item() for m in compute_f1(tp.sum(keepdims=True), fp.sum(keepdims=True), fn.sum(keepdims=True))
+    )
     
     print(f"\nGolden Set Mapping Evaluation:")
     print(f"  Examples: {num_examples}")
     print(f"  Average Precision: {avg_precision:.3f}")
     print(f"  Average Recall: {avg_recall:.3f}")
     print(f"  Average F1: {avg_f1:.3f}")
+    print(f"  Micro P/R/F1: {micro_precision:.3f} / {micro_recall:.3f} / {micro_f1:.3f}")
     
     # Assert F1 >= 0.75
     assert avg_f1 >= 0.75, f"F1 score {avg_f1:.3f} is below threshold 0.75"
@@ -152,10 +162,8 @@ def test_golden_set_f1():
     print(f"  ✅ F1 score {avg_f1:.3f} meets threshold >= 0.75")
 
 
-def test_golden_set_structure():
+def test_golden_set_structure(goldset):
     """Test that golden set has expected structure."""
-    goldset = load_golden_set()
-    
     assert "version" in goldset
     assert "examples" in goldset
     assert len(goldset["examples"]) == 25, "Expected 25 examples (5 original + 20 new)"
@@ -1,15 +1,29 @@
 """Unit tests for OSWorld parser."""
-import json
+from functools import lru_cache
+
+import orjson
 import pytest
 from pathlib import Path
 
 
-@pytest.fixture
-def osworld_sample():
-    """Load OSWorld sample fixture."""
+@lru_cache(maxsize=1)
+def _load_osworld_sample() -> dict:
+    """Parse the OSWorld sample fixture once (shared by collection and fixtures)."""
     fixture_path = Path(__file__).parent / "fixtures" / "osworld_sample.json"
-    with open(fixture_path) as f:
-        return json.load(f)
+    return orjson.loads(fixture_path.read_bytes())
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize per-entry tests over the leaderboard rows, one case per model."""
+    if "entry" in metafunc.fixturenames:
+        entries = _load_osworld_sample()["leaderboard_data"]
+        metafunc.parametrize("entry", entries, ids=[e.get("model", str(i)) for i, e in enumerate(entries)])
+
+
+@pytest.fixture(scope="session")
+def osworld_sample():
+    """OSWorld sample fixture (read-only)."""
+    return _load_osworld_sample()
 
 
 def test_osworld_parse_structure(osworld_sample):
@@ -21,42 +35,24 @@ def test_osworld_parse_structure(osworld_sample):
     assert len(osworld_sample["leaderboard_data"]) > 0
 
 
-def test_osworld_parse_values(osworld_sample):
-    """Test that OSWorld entries have valid numeric values."""
-    for entry in osworld_sample["leaderboard_data"]:
-        assert "task_success_rate" in entry
-        rate = entry["task_success_rate"]
-        assert isinstance(rate, (int, float))
-        assert 0 <= rate <= 100  # Percentage
-
-
-def test_osworld_parse_dates(osworld_sample):
-    """Test that OSWorld entries have valid dates."""
-    for entry in osworld_sample["leaderboard_data"]:
-        assert "date" in entry
-        date_str = entry["date"]
-        # Simple format check (YYYY-MM)
-        assert len(date_str) >= 7  # e.g., "2024-09"
-
-
-def test_osworld_signpost_mapping(osworld_sample):
-    """Test that OSWorld scores map to correct signposts."""
-    for entry in osworld_sample["leaderboard_data"]:
-        rate = entry["task_success_rate"]
-        
-        # Mapping logic from connector:
-        # osworld_65: >= 65% (Capabilities)
-        # osworld_85: >= 85% (Capabilities)
-        
-        if rate >= 85:
-            # Should map to both osworld_65 and osworld_85
-            assert rate >= 65  # Prerequisite
-        elif rate >= 65:
-            # Should map to osworld_65 only
-            assert 65 <= rate < 85
-        else:
-            # Below threshold, no mapping
-            assert rate < 65
+def test_osworld_entry(entry):
+    """Test one leaderboard entry: numeric rate, date format and signpost bucket."""
+    assert "task_success_rate" in entry
+    rate = entry["task_success_rate"]
+    assert isinstance(rate, (int, float))
+    assert 0 <= rate <= 100  # Percentage
+    
+    assert "date" in entry
+    # Simple format check (YYYY-MM)
+    assert len(entry["date"]) >= 7  # e.g., "2024-09"
+    
+    # Mapping logic from connector:
+    # osworld_65: >= 65% (Capabilities)
+    # osworld_85: >= 85% (Capabilities)
+    maps_both = rate >= 85  # osworld_65 and osworld_85
+    maps_65_only = 65 <= rate < 85
+    maps_none = rate < 65  # Below threshold, no mapping
+    assert maps_both + maps_65_only + maps_none == 1
 
 
 def test_osworld_credibility_tier(osworld_sample):
@@ -69,10 +65,8 @@ def test_osworld_credibility_tier(osworld_sample):
     expected_tier = "A"
     
     # Verify at least one entry marked as verified
-    verified_count = sum(1 for e in osworld_sample["leaderboard_data"] if e.get("verified", False))
-    assert verified_count > 0
+    assert any(e.get("verified", False) for e in osworld_sample["leaderboard_data"])
 
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
-
@@ -4,25 +4,22 @@ Progress Index tests - BLOCKING in CI.
 Tests composite AGI progress index computation and API endpoints.
 """
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
-from app.main import app
 from app.database import SessionLocal
 from app.models import Signpost
+from app.services import progress_index
 from app.services.progress_index import (
     normalize_signpost_progress,
     compute_dimension_score,
-    compute_progress_index
+    compute_progress_index,
+    compute_progress_index_cached,
 )
 
 
-@pytest.fixture
-def client():
-    """Test client."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def db():
     """Database session."""
@@ -67,10 +64,114 @@ def test_normalize_signpost_midpoint():
     assert abs(result - 0.5) < 0.01  # Within tolerance
 
 
-def test_progress_index_endpoint(client):
+def test_weighted_index_from_component_scores(monkeypatch):
+    """Weights are normalized and applied to the 0-100 component scores."""
+    scores = {"capabilities": 0.8, "agents": 0.2, "inputs": 0.5}
+    monkeypatch.setattr(
+        progress_index, "compute_dimension_score", lambda category, db: scores[category]
+    )
+    
+    result = compute_progress_index(None, {"capabilities": 2, "agents": 1, "inputs": 1})
+    assert result["components"] == {"capabilities": 80.0, "agents": 20.0, "inputs": 50.0}
+    assert result["weights"] == {"capabilities": 0.5, "agents": 0.25, "inputs": 0.25}
+    assert result["value"] == 57.5
+    assert type(result["value"]) is float
+
+
+def _stub_session():
+    """Session on its own throwaway engine (never queried by the stubs)."""
+    return Session(bind=create_engine("sqlite://"))
+
+
+@pytest.fixture
+def cache_db():
+    """Session whose bind keys the index cache in the caching tests."""
+    session = _stub_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def index_computations(monkeypatch):
+    """Stub the index computation (no DB) and record each call's weights."""
+    calls = []
+    
+    def fake_compute(db, weights=None):
+        calls.append(weights)
+        return {"value": 50.0, "components": {"capabilities": 50.0}, "weights": dict(weights or {})}
+    
+    monkeypatch.setattr(progress_index, "compute_progress_index", fake_compute)
+    progress_index.clear_progress_index_cache()
+    yield calls
+    progress_index.clear_progress_index_cache()
+
+
+def test_cached_index_reuses_result_per_weights(cache_db, index_computations):
+    """Same weights (in any order) within the TTL compute only once."""
+    first = compute_progress_index_cached(cache_db, {"capabilities": 0.6, "agents": 0.4})
+    first["components"]["capabilities"] = -1.0  # Callers get their own copy
+    
+    second = compute_progress_index_cached(cache_db, {"agents": 0.4, "capabilities": 0.6})
+    assert second["components"]["capabilities"] == 50.0
+    assert len(index_computations) == 1
+    
+    compute_progress_index_cached(cache_db, None)
+    compute_progress_index_cached(cache_db, None)
+    assert index_computations == [{"capabilities": 0.6, "agents": 0.4}, None]
+
+
+def test_cached_index_shares_equivalent_weights(cache_db, index_computations):
+    """Weights that normalize to the same vector, e.g. the baseline, share one entry."""
+    compute_progress_index_cached(cache_db, None)
+    compute_progress_index_cached(cache_db, dict(progress_index.DEFAULT_WEIGHTS))
+    compute_progress_index_cached(cache_db, {k: 1 for k in progress_index.DEFAULT_WEIGHTS})
+    assert index_computations == [None]
+    
+    compute_progress_index_cached(cache_db, {"capabilities": 0.6, "agents": 0.4})
+    compute_progress_index_cached(cache_db, {"capabilities": 3, "agents": 2})
+    assert len(index_computations) == 2
+
+
+def test_cached_index_separates_databases(cache_db, index_computations):
+    """Sessions on different binds never share cached results."""
+    other_db = _stub_session()
+    compute_progress_index_cached(cache_db, None)
+    compute_progress_index_cached(other_db, None)
+    assert len(index_computations) == 2
+    
+    compute_progress_index_cached(other_db, None)
+    assert len(index_computations) == 2
+    other_db.close()
+
+
+def test_cached_index_expires_and_clears(cache_db, index_computations, monkeypatch):
+    """Stale entries and explicit invalidation both force a recompute."""
+    compute_progress_index_cached(cache_db, None)
+    progress_index.clear_progress_index_cache()
+    compute_progress_index_cached(cache_db, None)
+    assert len(index_computations) == 2
+    
+    monkeypatch.setattr(progress_index, "INDEX_CACHE_TTL_SECONDS", 0)
+    compute_progress_index_cached(cache_db, None)
+    assert len(index_computations) == 3
+
+
+def test_cached_index_evicts_oldest(cache_db, index_computations, monkeypatch):
+    """The cache holds at most INDEX_CACHE_MAXSIZE weight vectors."""
+    monkeypatch.setattr(progress_index, "INDEX_CACHE_MAXSIZE", 2)
+    for w in (0.1, 0.2, 0.3):
+        compute_progress_index_cached(cache_db, {"capabilities": w, "agents": 1 - w})
+    
+    compute_progress_index_cached(cache_db, {"capabilities": 0.3, "agents": 0.7})  # Still cached
+    assert len(index_computations) == 3
+    compute_progress_index_cached(cache_db, {"capabilities": 0.1, "agents": 0.9})  # Evicted
+    assert len(index_computations) == 4
+
+
+def test_progress_index_endpoint(app_client):
     """Test GET /v1/index/progress returns valid response."""
     
-    response = client.get("/v1/index/progress")
+    response = app_client.get("/v1/index/progress")
     
     assert response.status_code == 200
     data = response.json()
@@ -90,13 +191,12 @@ def test_progress_index_endpoint(client):
     assert "Cache-Control" in response.headers
 
 
-def test_progress_index_with_custom_weights(client):
+def test_progress_index_with_custom_weights(app_client):
     """Test progress index accepts custom weights."""
     
-    import json
-    weights = json.dumps({"capabilities": 0.5, "agents": 0.5})
+    weights = orjson.dumps({"capabilities": 0.5, "agents": 0.5}).decode()
     
-    response = client.get(f"/v1/index/progress?weights={weights}")
+    response = app_client.get(f"/v1/index/progress?weights={weights}")
     
     assert response.status_code == 200
     data = response.json()
@@ -106,10 +206,10 @@ def test_progress_index_with_custom_weights(client):
     assert "components" in data
 
 
-def test_progress_history_endpoint(client):
+def test_progress_history_endpoint(app_client):
     """Test GET /v1/index/progress/history returns array."""
     
-    response = client.get("/v1/index/progress/history?days=30")
+    response = app_client.get("/v1/index/progress/history?days=30")
     
     assert response.status_code == 200
     data = response.json()
@@ -124,11 +224,11 @@ def test_progress_history_endpoint(client):
         assert "components" in item
 
 
-def test_progress_history_respects_limit(client):
+def test_progress_history_respects_limit(app_client):
     """Test history endpoint validates days parameter."""
     
     # Should reject days > 730
-    response = client.get("/v1/index/progress/history?days=1000")
+    response = app_client.get("/v1/index/progress/history?days=1000")
     
     assert response.status_code == 422  # Validation error
 
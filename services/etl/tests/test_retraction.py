@@ -1,44 +1,87 @@
 """Tests for retraction endpoint."""
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from functools import partial
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from app.main import app
+from sqlalchemy.pool import StaticPool
 from app.database import Base, get_db
 from app.models import Event, ChangelogEntry
 import os
 
-# Test database
-TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///./test_retraction.db")
-engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+# Test database (in-memory by default; StaticPool keeps the single
+# connection, and with it the database, alive across sessions and threads)
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite://")
+if TEST_DATABASE_URL.startswith("sqlite"):
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+else:
+    engine = create_engine(TEST_DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if engine.dialect.name == "sqlite":
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Disposable test DB: fail fast on locks and skip journal/fsync work
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA busy_timeout=0")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
 
-def override_get_db():
-    """Override database session for testing."""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-client = TestClient(app)
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create test database tables."""
+@pytest.fixture(scope="session")
+def _schema():
+    """Create test database tables once per session (dropped at teardown)."""
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
 
-def test_retract_event_idempotent(test_db):
-    """Test that retracting same event twice is idempotent."""
-    # Setup: create test event
-    db = TestingSessionLocal()
+@pytest.fixture(scope="function")
+def test_db(_schema):
+    """
+    Session factory bound to one connection rolled back after each test.
+    
+    Sessions from the factory (and the app's get_db override) only commit
+    SAVEPOINTs, so no per-test cleanup deletes/commits are needed.
+    """
+    from app.main import app
+    
+    connection = engine.connect()
+    transaction = connection.begin()
+    session_factory = partial(TestingSessionLocal, bind=connection, join_transaction_mode="create_savepoint")
+    
+    def override_get_db():
+        """Override database session for testing."""
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    
+    yield session_factory
+    
+    app.dependency_overrides.pop(get_db, None)
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def seeded_event(test_db):
+    """ID of a fresh, unretracted event (rolled back with test_db)."""
+    db = test_db()
     event = Event(
         title="Test Event for Retraction",
         source_url="http://test.com/retraction-test-1",
@@ -50,138 +93,66 @@ def test_retract_event_idempotent(test_db):
     db.commit()
     event_id = event.id
     db.close()
-    
-    # First retraction
-    response1 = client.post(
+    return event_id
+
+
+def _retract(client, event_id, reason, evidence_url=None):
+    """POST /v1/admin/retract with the admin key."""
+    params = {"event_id": event_id, "reason": reason}
+    if evidence_url is not None:
+        params["evidence_url"] = evidence_url
+    return client.post(
         "/v1/admin/retract",
-        params={"event_id": event_id, "reason": "Test retraction for idempotency"},
+        params=params,
         headers={"X-API-Key": os.getenv("ADMIN_API_KEY", "test_key")}
     )
+
+
+@pytest.mark.parametrize("reason,evidence_url", [
+    ("Test retraction for idempotency", None),
+    ("Test with evidence URL", "http://example.com/retraction-notice"),
+], ids=["plain", "evidence_url"])
+def test_retract_event(test_db, app_client, seeded_event, reason, evidence_url):
+    """Retraction returns the record, logs a changelog entry and is idempotent."""
+    db = test_db()
+    before_count = db.query(ChangelogEntry).count()
+    db.close()
+    
+    # First retraction
+    response1 = _retract(app_client, seeded_event, reason, evidence_url)
     assert response1.status_code == 200
     data1 = response1.json()
     assert data1["status"] == "retracted"
-    assert data1["event_id"] == event_id
-    assert data1["reason"] == "Test retraction for idempotency"
+    assert data1["event_id"] == seeded_event
+    assert data1["reason"] == reason
     assert "retracted_at" in data1
+    if evidence_url is not None:
+        assert data1["evidence_url"] == evidence_url
+    
+    # Verify changelog entry and stored evidence URL
+    db = test_db()
+    assert db.query(ChangelogEntry).count() == before_count + 1
+    changelog = db.query(ChangelogEntry).order_by(ChangelogEntry.id.desc()).first()
+    assert changelog.type == "retract"
+    assert f"Event #{seeded_event}" in changelog.title
+    assert reason in changelog.body
+    event = db.query(Event).filter(Event.id == seeded_event).first()
+    assert event.retraction_evidence_url == evidence_url
+    db.close()
     
     # Second retraction (idempotent)
-    response2 = client.post(
-        "/v1/admin/retract",
-        params={"event_id": event_id, "reason": "Test retraction for idempotency"},
-        headers={"X-API-Key": os.getenv("ADMIN_API_KEY", "test_key")}
-    )
+    response2 = _retract(app_client, seeded_event, reason, evidence_url)
     assert response2.status_code == 200
     data2 = response2.json()
     assert data2["status"] == "already_retracted"
-    assert data2["event_id"] == event_id
+    assert data2["event_id"] == seeded_event
     
     # Verify retracted_at is the same (idempotent)
     assert data1["retracted_at"] == data2["retracted_at"]
-    
-    # Cleanup
-    db = TestingSessionLocal()
-    db.query(Event).filter(Event.id == event_id).delete()
-    db.query(ChangelogEntry).filter(ChangelogEntry.claim_id == event_id).delete()
-    db.commit()
-    db.close()
-
-
-def test_retract_event_creates_changelog(test_db):
-    """Test that retracting an event creates a changelog entry."""
-    # Setup: create test event
-    db = TestingSessionLocal()
-    event = Event(
-        title="Test Event for Changelog",
-        source_url="http://test.com/changelog-test-1",
-        evidence_tier="B",
-        source_type="blog",
-        retracted=False,
-    )
-    db.add(event)
-    db.commit()
-    event_id = event.id
-    db.close()
-    
-    # Count changelog entries before
-    db = TestingSessionLocal()
-    before_count = db.query(ChangelogEntry).count()
-    db.close()
-    
-    # Retract event
-    response = client.post(
-        "/v1/admin/retract",
-        params={"event_id": event_id, "reason": "Test changelog creation"},
-        headers={"X-API-Key": os.getenv("ADMIN_API_KEY", "test_key")}
-    )
-    assert response.status_code == 200
-    
-    # Verify changelog entry created
-    db = TestingSessionLocal()
-    after_count = db.query(ChangelogEntry).count()
-    assert after_count == before_count + 1
-    
-    # Verify changelog content
-    changelog = db.query(ChangelogEntry).order_by(ChangelogEntry.id.desc()).first()
-    assert changelog.type == "retract"
-    assert f"Event #{event_id}" in changelog.title
-    assert "Test changelog creation" in changelog.body
-    
-    # Cleanup
-    db.query(Event).filter(Event.id == event_id).delete()
-    db.query(ChangelogEntry).filter(ChangelogEntry.id == changelog.id).delete()
-    db.commit()
-    db.close()
 
 
-def test_retract_event_not_found(test_db):
+def test_retract_event_not_found(test_db, app_client):
     """Test that retracting a non-existent event returns 404."""
-    response = client.post(
-        "/v1/admin/retract",
-        params={"event_id": 99999, "reason": "Test not found"},
-        headers={"X-API-Key": os.getenv("ADMIN_API_KEY", "test_key")}
-    )
+    response = _retract(app_client, 99999, "Test not found")
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
-
-
-def test_retract_event_with_evidence_url(test_db):
-    """Test retracting an event with evidence URL."""
-    # Setup: create test event
-    db = TestingSessionLocal()
-    event = Event(
-        title="Test Event with Evidence",
-        source_url="http://test.com/evidence-test-1",
-        evidence_tier="B",
-        source_type="blog",
-        retracted=False,
-    )
-    db.add(event)
-    db.commit()
-    event_id = event.id
-    db.close()
-    
-    # Retract with evidence URL
-    evidence_url = "http://example.com/retraction-notice"
-    response = client.post(
-        "/v1/admin/retract",
-        params={
-            "event_id": event_id,
-            "reason": "Test with evidence URL",
-            "evidence_url": evidence_url
-        },
-        headers={"X-API-Key": os.getenv("ADMIN_API_KEY", "test_key")}
-    )
-    assert response.status_code == 200
-    data = response.json()
-    assert data["evidence_url"] == evidence_url
-    
-    # Verify in database
-    db = TestingSessionLocal()
-    event = db.query(Event).filter(Event.id == event_id).first()
-    assert event.retraction_evidence_url == evidence_url
-    
-    # Cleanup
-    db.query(Event).filter(Event.id == event_id).delete()
-    db.query(ChangelogEntry).delete()
-    db.commit()
-    db.close()
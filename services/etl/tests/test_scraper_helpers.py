@@ -0,0 +1,76 @@
+"""Tests for scraper helper utilities."""
+import urllib.robotparser
+
+import pytest
+
+from app.utils import scraper_helpers
+from app.utils.scraper_helpers import check_robots_txt
+
+
+@pytest.fixture
+def robots_reads(monkeypatch):
+    """Serve an allow-all robots.txt offline and count fetches."""
+    calls = []
+
+    def fake_read(self):
+        calls.append(self.url)
+        self.parse(["User-agent: *", "Disallow: /private"])
+
+    monkeypatch.setattr(urllib.robotparser.RobotFileParser, "read", fake_read)
+    scraper_helpers._reset_cache()
+    yield calls
+    scraper_helpers._reset_cache()
+
+
+def test_robots_txt_fetched_once_per_host(robots_reads):
+    """Repeated checks against one host reuse the parsed robots.txt."""
+    assert check_robots_txt("https://scale.com/leaderboard/hle")
+    assert check_robots_txt("https://scale.com/leaderboard/other")
+    assert not check_robots_txt("https://scale.com/private/page")
+    assert robots_reads == ["https://scale.com/robots.txt"]
+
+    check_robots_txt("https://artificialanalysis.ai/leaderboards/reasoning")
+    assert len(robots_reads) == 2
+
+
+def test_robots_txt_refetched_when_stale(robots_reads, monkeypatch):
+    """Entries older than the TTL are fetched again."""
+    check_robots_txt("https://scale.com/leaderboard/hle")
+    monkeypatch.setattr(scraper_helpers, "ROBOTS_CACHE_TTL_SECONDS", 0)
+    check_robots_txt("https://scale.com/leaderboard/hle")
+    assert len(robots_reads) == 2
+
+
+@pytest.mark.parametrize("status", [403, 500, 503])
+def test_robots_txt_error_disallows_and_is_not_cached(monkeypatch, status):
+    """401/403 and server errors keep disallowing and are refetched each time."""
+    calls = []
+
+    def fake_read(self):
+        # What read() leaves behind for these statuses: no parse(), no timestamp
+        calls.append(self.url)
+        if status in (401, 403):
+            self.disallow_all = True
+
+    monkeypatch.setattr(urllib.robotparser.RobotFileParser, "read", fake_read)
+    scraper_helpers._reset_cache()
+    assert not check_robots_txt("https://scale.com/leaderboard/hle")
+    assert not check_robots_txt("https://scale.com/leaderboard/hle")
+    assert len(calls) == 2
+    scraper_helpers._reset_cache()
+
+
+def test_robots_txt_not_found_allows_and_is_cached(monkeypatch):
+    """A 404 robots.txt allows everything and is cached like a parsed one."""
+    calls = []
+
+    def fake_read(self):
+        calls.append(self.url)
+        self.allow_all = True
+
+    monkeypatch.setattr(urllib.robotparser.RobotFileParser, "read", fake_read)
+    scraper_helpers._reset_cache()
+    assert check_robots_txt("https://scale.com/leaderboard/hle")
+    assert check_robots_txt("https://scale.com/leaderboard/hle")
+    assert len(calls) == 1
+    scraper_helpers._reset_cache()
@@ -2,55 +2,42 @@
 Security tests - These are BLOCKING in CI.
 
 Tests critical security features that must never regress:
-- SafeLink URL validation
 - CSV formula injection prevention
 - Auth constant-time comparison
+
+SafeLink URL validation is TypeScript-only and tested with the web app.
 """
 
 import pytest
-from app.lib.csv_utils import sanitize_csv_cell  # Will create this
-
-
-class TestUrlSecurity:
-    """Test SafeLink URL validation (mirrored from TS SafeLink.tsx)"""
-    
-    def test_blocks_javascript_urls(self):
-        """Block javascript: scheme"""
-        from apps.web.lib.SafeLink import is_url_safe  # Would need Python equivalent
-        # For now, document the TypeScript test exists
-        assert True  # Placeholder - SafeLink is TypeScript
-    
-    def test_blocks_data_urls(self):
-        """Block data: scheme"""
-        assert True  # Placeholder - SafeLink is TypeScript
-    
-    def test_allows_https_urls(self):
-        """Allow https: scheme"""
-        assert True  # Placeholder - SafeLink is TypeScript
 
 
 class TestCsvSecurity:
     """Test CSV formula injection prevention - BLOCKING"""
     
-    def test_escapes_formula_characters(self):
-        """Escape leading = + - @ | to prevent formula execution"""
+    @pytest.mark.parametrize("cell,expected", [
         # These characters can execute code in Excel/Sheets
-        assert sanitize_csv_cell("=SUM(A1:A10)") == "'=SUM(A1:A10)"
-        assert sanitize_csv_cell("+1234567890") == "'+1234567890"
-        assert sanitize_csv_cell("-1234567890") == "'-1234567890"
-        assert sanitize_csv_cell("@SUM(A1:A10)") == "'@SUM(A1:A10)"
-        assert sanitize_csv_cell("|cmd") == "'|cmd"
-    
-    def test_leaves_safe_values_unchanged(self):
-        """Don't escape normal values"""
-        assert sanitize_csv_cell("Normal title") == "Normal title"
-        assert sanitize_csv_cell("123") == "123"
-        assert sanitize_csv_cell("Title: Research") == "Title: Research"
-    
-    def test_handles_empty_and_none(self):
-        """Handle edge cases"""
-        assert sanitize_csv_cell("") == ""
-        assert sanitize_csv_cell(None) == None
+        ("=SUM(A1:A10)", "'=SUM(A1:A10)"),
+        ("+1234567890", "'+1234567890"),
+        ("-1234567890", "'-1234567890"),
+        ("@SUM(A1:A10)", "'@SUM(A1:A10)"),
+        ("|cmd", "'|cmd"),
+        # Safe values are left unchanged
+        ("Normal title", "Normal title"),
+        ("123", "123"),
+        ("Title: Research", "Title: Research"),
+        ("a=b", "a=b"),
+        # Only the ASCII prefixes are formula triggers
+        ("＝SUM(A1:A10)", "＝SUM(A1:A10)"),
+        ("é=1", "é=1"),
+        # Edge cases
+        ("", ""),
+        (None, None),
+    ])
+    def test_sanitize_csv_cell(self, cell, expected):
+        """Escape leading = + - @ | and leave everything else alone"""
+        from app.lib.csv_utils import sanitize_csv_cell
+        
+        assert sanitize_csv_cell(cell) == expected
 
 
 class TestAuthSecurity:
@@ -59,12 +46,16 @@ class TestAuthSecurity:
     def test_constant_time_comparison(self):
         """Verify auth uses secrets.compare_digest (not ==)"""
         from app.auth import verify_api_key
-        import inspect
+        import dis
         
-        # Check that verify_api_key uses compare_digest
-        source = inspect.getsource(verify_api_key)
-        assert "compare_digest" in source, "Auth must use constant-time comparison"
-        assert "!=" not in source or "compare_digest" in source, "No direct string comparison"
+        # Check the compiled function (no source file read): it must call
+        # compare_digest and never compare keys with == / !=
+        assert "compare_digest" in verify_api_key.__code__.co_names, "Auth must use constant-time comparison"
+        compare_ops = {
+            ins.argval for ins in dis.get_instructions(verify_api_key)
+            if ins.opname == "COMPARE_OP"
+        }
+        assert not {"==", "!="} & compare_ops, "No direct string comparison"
     
     def test_auth_rejects_invalid_key(self):
         """Auth must reject invalid keys"""
@@ -74,21 +65,3 @@ class TestAuthSecurity:
         # This would need proper FastAPI test client setup
         # For now, ensure function signature is correct
         assert callable(verify_api_key)
-
-
-def sanitize_csv_cell(value):
-    """
-    Prevent CSV formula injection by escaping dangerous leading characters.
-    
-    Excel/Google Sheets execute cells starting with: = + - @ |
-    Prefix with single quote to treat as text instead of formula.
-    """
-    if not value or not isinstance(value, str):
-        return value
-    
-    # Check if starts with dangerous character
-    if len(value) > 0 and value[0] in '=+-@|':
-        return f"'{value}"
-    
-    return value
-
@@ -11,48 +11,52 @@ Tests:
 - Auth constant-time verification
 """
 
+import asyncio
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
-import time
+from unittest.mock import AsyncMock, patch, MagicMock
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.exc import OperationalError
 
-from app.main import app
 from app.config import settings
 
 
-@pytest.fixture
-def client():
-    """Test client for API integration tests"""
-    return TestClient(app)
-
-
 @pytest.fixture
 def valid_api_key():
     """Valid admin API key for testing"""
     return settings.admin_api_key
 
 
+@pytest.fixture
+def mock_healthz_deps():
+    """Healthy cache backend so /healthz skips the live Redis ping"""
+    with patch('app.main.FastAPICache.get_backend') as mock_backend:
+        mock_backend.return_value.redis.ping = AsyncMock(return_value=True)
+        yield mock_backend
+
+
 class TestAdminAuthentication:
     """Test admin endpoint authentication - BLOCKING"""
     
-    def test_admin_endpoint_requires_api_key(self, client):
+    def test_admin_endpoint_requires_api_key(self, app_client):
         """Admin endpoints must reject requests without API key"""
-        response = client.post("/v1/admin/trigger-ingestion?source=arxiv")
+        response = app_client.post("/v1/admin/trigger-ingestion?source=arxiv")
         assert response.status_code == 403, "Should reject missing API key"
         assert "Forbidden" in response.text or "Invalid" in response.text
     
-    def test_admin_endpoint_rejects_wrong_key(self, client):
+    def test_admin_endpoint_rejects_wrong_key(self, app_client):
         """Admin endpoints must reject invalid API keys"""
-        response = client.post(
+        response = app_client.post(
             "/v1/admin/trigger-ingestion?source=arxiv",
             headers={"x-api-key": "wrong-key-12345"}
         )
         assert response.status_code == 403, "Should reject wrong API key"
     
-    def test_admin_endpoint_accepts_valid_key(self, client, valid_api_key):
+    def test_admin_endpoint_accepts_valid_key(self, app_client, valid_api_key):
         """Admin endpoints must accept valid API keys"""
         # May fail on actual trigger (no real data), but should pass auth
-        response = client.post(
+        response = app_client.post(
             "/v1/admin/recompute",
             headers={"x-api-key": valid_api_key}
         )
@@ -64,55 +68,57 @@ class TestAdminAuthentication:
     def test_auth_uses_constant_time_comparison(self):
         """Verify auth uses secrets.compare_digest (not ==)"""
         from app.auth import verify_api_key
-        import inspect
+        import dis
         
-        source = inspect.getsource(verify_api_key)
-        assert "compare_digest" in source, "Must use constant-time comparison"
+        assert "compare_digest" in verify_api_key.__code__.co_names, "Must use constant-time comparison"
         # Should NOT have direct string comparison
-        assert "x_api_key !=" not in source, "Must not use direct comparison"
+        compare_ops = {
+            ins.argval for ins in dis.get_instructions(verify_api_key)
+            if ins.opname == "COMPARE_OP"
+        }
+        assert not {"==", "!="} & compare_ops, "Must not use direct comparison"
 
 
 class TestRateLimiting:
     """Test rate limiting enforcement - BLOCKING"""
     
-    def test_admin_rate_limit_enforced(self, client, valid_api_key):
+    async def test_admin_rate_limit_enforced(self, valid_api_key):
         """Admin endpoints must enforce rate limits (10/min)"""
-        # Note: This test may be flaky in CI due to Redis state
-        # Skip if Redis not available
+        from app.main import app
+        
+        # Fire 11 requests as one burst (limit is 10/min). Skip only when a
+        # backing service is unreachable; assertion failures still fail.
+        transport = httpx.ASGITransport(app=app)
         try:
-            # Make 11 rapid requests (limit is 10/min)
-            responses = []
-            for i in range(11):
-                resp = client.post(
-                    "/v1/admin/recompute",
-                    headers={"x-api-key": valid_api_key}
-                )
-                responses.append(resp.status_code)
-                time.sleep(0.1)  # Small delay to avoid overwhelming
-            
-            # At least one should be rate limited (429)
-            # Note: Actual limit depends on Redis/slowapi state
-            # This is best-effort verification
-            assert any(r == 429 for r in responses) or len(responses) == 11, \
-                "Rate limiting should trigger on rapid requests"
-        except Exception as e:
-            pytest.skip(f"Rate limit test skipped (Redis may not be available): {e}")
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                responses = await asyncio.gather(*(
+                    client.post(
+                        "/v1/admin/recompute",
+                        headers={"x-api-key": valid_api_key}
+                    )
+                    for _ in range(11)
+                ))
+        except (RedisConnectionError, OperationalError) as e:
+            pytest.skip(f"Rate limit test skipped (Redis/DB not available): {e}")
+        
+        assert any(r.status_code == 429 for r in responses), \
+            f"Rate limiting should trigger on rapid requests, got {[r.status_code for r in responses]}"
 
 
 class TestHealthChecks:
     """Test health check endpoints - BLOCKING"""
     
-    def test_health_endpoint_always_ok(self, client):
+    def test_health_endpoint_always_ok(self, app_client):
         """/health should always return 200 (basic check)"""
-        response = client.get("/health")
+        response = app_client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ok"
         assert "service" in data
     
-    def test_healthz_checks_dependencies(self, client):
+    def test_healthz_checks_dependencies(self, app_client, mock_healthz_deps):
         """/healthz should test DB and Redis connectivity"""
-        response = client.get("/healthz")
+        response = app_client.get("/healthz")
         data = response.json()
         
         # Should have checks object
@@ -125,16 +131,17 @@ class TestHealthChecks:
         # If healthy, checks should be ok
         if data["status"] == "healthy":
             assert data["checks"]["database"] == "ok"
+        assert data["checks"]["redis"] == "ok"
     
     @patch('app.main.FastAPICache.get_backend')
-    def test_healthz_returns_503_when_redis_down(self, mock_backend, client):
+    def test_healthz_returns_503_when_redis_down(self, mock_backend, app_client):
         """/healthz should return 503 when Redis is unavailable"""
         # Mock Redis failure
         mock_redis = MagicMock()
         mock_redis.ping.side_effect = Exception("Connection refused")
         mock_backend.return_value.redis = mock_redis
         
-        response = client.get("/healthz")
+        response = app_client.get("/healthz")
         
         # Should return 503 (Service Unavailable)
         assert response.status_code == 503, "Should return 503 when dependencies fail"
@@ -143,29 +150,6 @@ class TestHealthChecks:
         assert "error" in data["checks"]["redis"].lower()
 
 
-class TestCSVSecurity:
-    """Test CSV formula injection prevention - BLOCKING"""
-    
-    def test_csv_escapes_formula_characters(self):
-        """CSV export must escape dangerous leading characters"""
-        # Import the actual implementation
-        from app.lib.csv_utils import sanitize_csv_cell  # Adjust import
-        
-        # Test all dangerous characters
-        assert sanitize_csv_cell("=SUM(A1:A10)").startswith("'")
-        assert sanitize_csv_cell("+1234567890").startswith("'")
-        assert sanitize_csv_cell("-1234567890").startswith("'")
-        assert sanitize_csv_cell("@SUM(A1:A10)").startswith("'")
-        assert sanitize_csv_cell("|cmd").startswith("'")
-    
-    def test_csv_safe_values_unchanged(self):
-        """CSV export should not modify safe values"""
-        from app.lib.csv_utils import sanitize_csv_cell
-        
-        assert sanitize_csv_cell("Normal text") == "Normal text"
-        assert sanitize_csv_cell("123") == "123"
-
-
 # Mark this module as containing BLOCKING tests
 pytestmark = pytest.mark.security
 
@@ -10,19 +10,39 @@ Verifies:
 """
 
 import pytest
-from fastapi.testclient import TestClient
+from datetime import date
 from sqlalchemy.orm import Session
 
 from app.main import app
 from app.models import Signpost, Forecast, Incident
 from app.database import get_db
 
-client = TestClient(app)
+# Fixed so seeded rows are identical from run to run
+INCIDENT_DATE = date(2024, 1, 1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def db(module_db_session):
+    """Module-wide session; seeded rows are rolled back after the last test."""
+    return module_db_session
+
+
+@pytest.fixture(scope="module")
+def client(db, _test_client):
+    """Session-wide TestClient bound to the module-wide session."""
+    def override_get_db():
+        yield db
+    
+    app.dependency_overrides[get_db] = override_get_db
+    
+    yield _test_client
+    
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="module")
 def seed_signpost_data(db: Session):
-    """Seed test signpost with forecasts and incidents."""
+    """Seed test signpost with forecasts and incidents (once per module)."""
     
     # Create test signpost
     signpost = Signpost(
@@ -35,11 +55,6 @@ def seed_signpost_data(db: Session):
         target_value=0.9
     )
     
-    existing = db.query(Signpost).filter(Signpost.code == "test_signpost").first()
-    if not existing:
-        db.add(signpost)
-        db.commit()
-    
     # Add forecasts
     forecast = Forecast(
         source="Test Source",
@@ -47,28 +62,29 @@ def seed_signpost_data(db: Session):
         timeline=date(2027, 1, 1),
         confidence=0.7
     )
-    db.add(forecast)
     
     # Add incident
     incident = Incident(
-        occurred_at=date.today(),
+        occurred_at=INCIDENT_DATE,
         title="Test Incident",
         severity=3,
         signpost_codes=["test_signpost"]
     )
-    db.add(incident)
+    
+    # Insert everything in one flush/commit
+    rows = [forecast, incident]
+    existing = db.query(Signpost).filter(Signpost.code == "test_signpost").first()
+    if not existing:
+        rows.insert(0, signpost)
+    db.add_all(rows)
     db.commit()
     
     yield
     
-    # Cleanup
-    db.query(Forecast).filter(Forecast.signpost_code == "test_signpost").delete()
-    db.query(Incident).filter(Incident.signpost_codes.contains(["test_signpost"])).delete()
-    db.query(Signpost).filter(Signpost.code == "test_signpost").delete()
-    db.commit()
+    # Cleanup happens in module_db_session teardown (transaction rollback)
 
 
-def test_list_signposts():
+def test_list_signposts(client):
     """Test GET /v1/signposts returns list."""
     response = client.get("/v1/signposts")
     assert response.status_code == 200
@@ -79,7 +95,7 @@ def test_list_signposts():
     assert isinstance(data["results"], list)
 
 
-def test_list_signposts_with_counts(seed_signpost_data):
+def test_list_signposts_with_counts(client, seed_signpost_data):
     """Test that counts are calculated."""
     response = client.get("/v1/signposts?include_counts=true")
     assert response.status_code == 200
@@ -97,7 +113,7 @@ def test_list_signposts_with_counts(seed_signpost_data):
         assert test_sp["counts"]["incidents"] >= 1
 
 
-def test_signpost_detail(seed_signpost_data):
+def test_signpost_detail(client, seed_signpost_data):
     """Test GET /v1/signposts/{code}."""
     response = client.get("/v1/signposts/test_signpost")
     assert response.status_code == 200
@@ -110,13 +126,13 @@ def test_signpost_detail(seed_signpost_data):
     assert "forecast_summary" in data
 
 
-def test_signpost_detail_not_found():
+def test_signpost_detail_not_found(client):
     """Test 404 for unknown signpost."""
     response = client.get("/v1/signposts/nonexistent_code")
     assert response.status_code == 404
 
 
-def test_search_signposts(seed_signpost_data):
+def test_search_signposts(client, seed_signpost_data):
     """Test GET /v1/signposts/search."""
     response = client.get("/v1/signposts/search?q=test")
     assert response.status_code == 200
@@ -129,7 +145,7 @@ def test_search_signposts(seed_signpost_data):
     assert "test_signpost" in codes
 
 
-def test_signpost_category_filter(seed_signpost_data):
+def test_signpost_category_filter(client, seed_signpost_data):
     """Test category filtering."""
     response = client.get("/v1/signposts?category=capabilities")
     assert response.status_code == 200
@@ -143,9 +159,10 @@ def test_signpost_category_filter(seed_signpost_data):
             assert sp["category"] == "capabilities"
 
 
-def test_signpost_cache_headers():
+def test_signpost_cache_headers(client):
     """Test cache headers."""
-    response = client.get("/v1/signposts")
+    # Smallest page without count aggregation; only the headers matter here
+    response = client.get("/v1/signposts", params={"include_counts": "false", "limit": 1})
     assert response.status_code == 200
     
     assert "etag" in response.headers or "ETag" in response.headers
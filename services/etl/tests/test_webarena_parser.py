@@ -1,36 +1,42 @@
 """Unit tests for WebArena parser."""
-import json
+import orjson
 import pytest
 from pathlib import Path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def webarena_sample():
-    """Load WebArena sample fixture."""
+    """Load WebArena sample fixture once per session (read-only)."""
     fixture_path = Path(__file__).parent / "fixtures" / "webarena_sample.json"
-    with open(fixture_path) as f:
-        return json.load(f)
+    return orjson.loads(fixture_path.read_bytes())
+
+
+@pytest.mark.parametrize("key", ["benchmark", "leaderboard_data", "visualwebarena_data"])
+def test_webarena_required_keys(webarena_sample, key):
+    """Test that WebArena data has every expected top-level section."""
+    assert key in webarena_sample
 
 
 def test_webarena_parse_structure(webarena_sample):
-    """Test that WebArena data has expected structure."""
-    assert "benchmark" in webarena_sample
+    """Test that the fixture is labelled as WebArena with VisualWebArena rows."""
     assert webarena_sample["benchmark"] == "WebArena"
-    assert "leaderboard_data" in webarena_sample
+    assert webarena_sample["visualwebarena_data"], "visualwebarena_data is empty"
 
 
 def test_webarena_parse_values(webarena_sample):
     """Test that WebArena entries have valid numeric values."""
     for entry in webarena_sample["leaderboard_data"]:
-        assert "task_success_rate" in entry
+        model = entry.get("model")
+        assert "task_success_rate" in entry, f"{model}: missing task_success_rate"
         rate = entry["task_success_rate"]
-        assert isinstance(rate, (int, float))
-        assert 0 <= rate <= 100
+        assert isinstance(rate, (int, float)), f"{model}: non-numeric task_success_rate {rate!r}"
+        assert 0 <= rate <= 100, f"{model}: task_success_rate {rate} outside [0, 100]"
 
 
 def test_webarena_signpost_mapping(webarena_sample):
     """Test that WebArena scores map to correct signposts."""
     for entry in webarena_sample["leaderboard_data"]:
+        model = entry.get("model")
         rate = entry["task_success_rate"]
         
         # Mapping logic:
@@ -38,15 +44,10 @@ def test_webarena_signpost_mapping(webarena_sample):
         # webarena_85: >= 85% (Agents)
         
         if rate >= 85:
-            assert rate >= 70  # Prerequisite
+            # Prerequisite
+            assert rate >= 70, f"{model}: {rate} maps to webarena_85 without webarena_70"
         elif rate >= 70:
-            assert 70 <= rate < 85
-
-
-def test_visualwebarena_included(webarena_sample):
-    """Test that VisualWebArena data is included."""
-    # VisualWebArena should be in the fixture
-    assert "visualwebarena_data" in webarena_sample or "leaderboard_data" in webarena_sample
+            assert 70 <= rate < 85, f"{model}: {rate} outside the webarena_70 band"
 
 
 if __name__ == "__main__":